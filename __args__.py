@@ -6,22 +6,26 @@ Ludorum argument definitions & parsing.
 __all__ = ["parse_ludorum_arguments"]
 
 from argparse       import ArgumentParser, _ArgumentGroup, Namespace, _SubParsersAction
+from functools      import cache
 
 from agents         import register_agent_parsers
 from environments   import register_environment_parsers
+from utilities      import LazyArgumentParser
 
+@cache
 def parse_ludorum_arguments() -> Namespace:
     """# Parse Ludorum Arguments.
     
     This function should be called at the entry point of the Ludorum application. The name space of 
     argument keys and values that it provides will be passed/provided to subsequent module entry 
-    points.
+    points. Arguments are only parsed on the first call; subsequent calls provide the same name 
+    space.
     
     ## Returns:
         * NameSpace:    Name space of parsed arguments and their values.
     """
     # Initialize primary parser
-    _parser_:       ArgumentParser =    ArgumentParser(
+    _parser_:       ArgumentParser =    LazyArgumentParser(
         prog =          "ludorum",
         description =   """Suite of environments, models, & methods in pursuit of achieving organic 
                         reasoning & logic by means of deep reinforcement learning."""
@@ -3,18 +3,24 @@
 This module handles the registration of agent parsers defined in agent sub-packages.
 """
 
-from argparse   import _SubParsersAction
+from typing     import TYPE_CHECKING
+
+if TYPE_CHECKING:   from utilities  import DeferredSubParsersAction
 
 def register_agent_parsers(
-    parent_subparser:   _SubParsersAction
+    parent_subparser:   "DeferredSubParsersAction"
 ) -> None:
     """# Register Agent Parsers.
+    
+    Agent parsers are only built if their command is selected.
 
     ## Args:
-        * parent_subparser  (_SubParsersAction): Parent's sub-parsers object.
+        * parent_subparser  (DeferredSubParsersAction): Parent's sub-parsers object.
     """
-    # Deferred agent parser imports.
-    from agents.q_learning  import register_q_learning_parser
-
     # Register agent parsers.
-    register_q_learning_parser(parent_subparser =   parent_subparser)
\ No newline at end of file
+    parent_subparser.defer_parser(
+        name =      "q-learning",
+        help =      "Q-Learning agent.",
+        module =    "agents.q_learning",
+        registrar = "register_q_learning_parser"
+    )
\ No newline at end of file
@@ -17,16 +17,44 @@ __all__ =   [
                 "q_learning"
             ]
 
+from importlib          import  import_module
+from typing             import  Any, Dict
+
 # Argument registration.
 from agents.__args__    import  register_agent_parsers
 
 # Abstract agent class.
 from agents.__base__    import  Agent
 
-# Agent classes.
-from agents.q_learning  import  QLearning
+# Agent classes & modules, mapped to the module that defines them. An agent package (along with its 
+# commands & their dependencies) is only imported once one of its exports is accessed.
+_LAZY_EXPORTS_: Dict[str, str] =    {
+                                        "QLearning":    "agents.q_learning",
+                                        "q_learning":   "agents.q_learning"
+                                    }
+
+def __getattr__(
+    name:   str
+) -> Any:
+    """# Get (Lazy) Attribute.
+
+    ## Args:
+        * name  (str):  Name of agent class or module being accessed.
+
+    ## Raises:
+        * AttributeError:   If package does not export attribute.
+
+    ## Returns:
+        * Any:  Agent class or module.
+    """
+    # Report attributes that are not exported.
+    if name not in _LAZY_EXPORTS_:  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import defining module.
+    module =                        import_module(_LAZY_EXPORTS_[name])
+
+    # Agent modules are exported as themselves, while classes are fetched from their module.
+    globals()[name] = attribute =   module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
 
-# Agent modules.
-from agents             import  (
-                                    q_learning
-                                )
\ No newline at end of file
+    # Provide attribute.
+    return attribute
@@ -5,7 +5,9 @@ implementations.
 """
 
 __all__ =   [
-                "QTable"
+                "QTable",
+                "TranspositionTable"
             ]
 
-from agents.components.q_table  import QTable
\ No newline at end of file
+from agents.components.q_table              import QTable
+from agents.components.transposition_table  import TranspositionTable
\ No newline at end of file
@@ -82,7 +82,7 @@ class QTable():
         ## Returns:
             * float:    Highest action value found for state.
         """
-        return np_max(self[self._normalize_state_(state = state)])
+        return float(np_max(self[state]))
     
     def load(self,
         path:   Union[str, Path]
@@ -162,6 +162,13 @@ class QTable():
         ## Returns:
             * Hashable: Hashable representation of unique state.
         """
+        # Integer states (the common case for tabular environments) skip array conversion.
+        if isinstance(state, int):  return (float(state),)
+        
+        # Flat tuples of scalars are converted element-wise.
+        if isinstance(state, tuple) and all(isinstance(s, (int, float)) for s in state): return tuple(map(float, state))
+        
+        # Otherwise, flatten state through numpy.
         return tuple(asarray(state).flatten().astype(float64))
             
     # DUNDERS ======================================================================================
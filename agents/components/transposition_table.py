@@ -0,0 +1,132 @@
+"""# ludorum.agents.components.transposition_table
+
+Defines the structure and operations of the transposition table.
+"""
+
+from collections    import OrderedDict
+from typing         import Any, Optional
+
+class TranspositionTable():
+    """# Transposition Table
+
+    Bounded cache of search results keyed by position hash (e.g., a Zobrist key). Once capacity is
+    reached, the least recently accessed entry is evicted.
+    """
+
+    def __init__(self,
+        capacity:   int =   1_000_000
+    ):
+        """# Instantiate Transposition Table.
+
+        ## Args:
+            * capacity  (int):  Maximum number of entries retained. Defaults to 1,000,000.
+        """
+        # Assert that capacity is positive.
+        assert capacity > 0, f"Transposition table capacity must be positive, got {capacity}"
+
+        # Define capacity.
+        self._capacity_:    int =                   capacity
+
+        # Initialize table.
+        self._table_:       OrderedDict[int, Any] = OrderedDict()
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def capacity(self) -> int:
+        """# (Table) Capacity
+
+        Maximum number of entries retained.
+        """
+        return self._capacity_
+
+    # METHODS ======================================================================================
+
+    def clear(self) -> None:
+        """# Clear (Table).
+
+        Remove all entries from table.
+        """
+        self._table_.clear()
+
+    def get(self,
+        key:        int,
+        default:    Optional[Any] = None
+    ) -> Any:
+        """# Get (Entry).
+
+        ## Args:
+            * key       (int):  Hash of position being looked up.
+            * default   (Any):  Value returned if position is not in table. Defaults to None.
+
+        ## Returns:
+            * Any:  Entry stored for position, or default if not found.
+        """
+        # If position is not in table, return default.
+        if key not in self._table_: return default
+
+        # Otherwise, mark entry as most recently accessed.
+        self._table_.move_to_end(key)
+
+        # Return entry.
+        return self._table_[key]
+
+    # DUNDERS ======================================================================================
+
+    def __contains__(self,
+        key:    int
+    ) -> bool:
+        """# Table Contains Position?
+
+        ## Args:
+            * key   (int):  Hash of position being searched for.
+
+        ## Returns:
+            * bool: True if position exists in table.
+        """
+        return key in self._table_
+
+    def __getitem__(self,
+        key:    int
+    ) -> Any:
+        """# Get Entry.
+
+        ## Args:
+            * key   (int):  Hash of position whose entry is being fetched.
+
+        ## Raises:
+            * KeyError: If position is not in table.
+
+        ## Returns:
+            * Any:  Entry stored for position.
+        """
+        # Mark entry as most recently accessed.
+        self._table_.move_to_end(key)
+
+        # Return entry.
+        return self._table_[key]
+
+    def __len__(self) -> int:
+        """# Table Length.
+
+        ## Returns:
+            * int:  Number of positions currently stored in table.
+        """
+        return len(self._table_)
+
+    def __setitem__(self,
+        key:    int,
+        value:  Any
+    ) -> None:
+        """# Set Entry.
+
+        ## Args:
+            * key   (int):  Hash of position.
+            * value (Any):  Entry being stored for position.
+        """
+        # Store entry as most recently accessed.
+        self._table_[key] = value
+        self._table_.move_to_end(key)
+
+        # Evict least recently accessed entry if capacity is exceeded.
+        if len(self._table_) > self._capacity_: self._table_.popitem(last = False)
@@ -6,10 +6,11 @@ Link to paper: https://link.springer.com/content/pdf/10.1007/BF00992698.pdf
 
 __all__ = ["QLearning"]
 
-from logging                import Logger
+from logging                import DEBUG, Logger
+from random                 import random
 
-from numpy                  import argmax, full, loadtxt, max, ndarray, savetxt, zeros
-from numpy.random           import normal, rand, randint, uniform
+from numpy                  import argmax, full, loadtxt, ndarray, savetxt, zeros
+from numpy.random           import normal, randint, uniform
 
 from agents.__base__        import Agent
 from agents.components      import QTable
@@ -142,8 +143,8 @@ class QLearning(Agent):
                                                         bootstrap_method =  bootstrap
                                                     )
         
-        # Log for debugging.
-        self.__logger__.debug(f"Initialized Q-Learning agent {locals()}")
+        # Log for debugging (rendering every argument is skipped unless debugging is enabled).
+        if self.__logger__.isEnabledFor(DEBUG): self.__logger__.debug(f"Initialized Q-Learning agent {locals()}")
         
     # PROPERTIES ===================================================================================
     
@@ -277,8 +278,9 @@ class QLearning(Agent):
         ## Returns:
             * int:  Index of action chosen.
         """
-        # Explore if exploration rate (epsilon) is higher than randomly chosen value.
-        if rand() < self._exploration_rate_: return self._action_space_.sample()
+        # Explore if exploration rate (epsilon) is higher than randomly chosen value (drawn from the 
+        # standard library, which is far cheaper than numpy for a single scalar).
+        if random() < self._exploration_rate_: return self._action_space_.sample()
         
         # Otherwise, choose max-value action from Q-table based on current state.
         return self._q_table_.get_best_action(state = state)
@@ -292,8 +294,8 @@ class QLearning(Agent):
         # Administer exploration rate decay.
         self.exploration_rate *= self.exploration_decay
         
-        # Log action for debugging.
-        self.__logger__.debug(f"Exploration rate updated to {self._exploration_rate_}")
+        # Log action for debugging (formatting is skipped unless debugging is enabled).
+        if self.__logger__.isEnabledFor(DEBUG): self.__logger__.debug(f"Exploration rate updated to {self._exploration_rate_}")
         
     def load_model(self,
         path:   str
@@ -341,19 +343,17 @@ class QLearning(Agent):
             * next_state    (int):      State of the agent after action is taken. 
             * done          (bool):     Indicates if agent has reached end state.
         """
-        # Log for debugging.
-        self.__logger__.debug(f"Updating Q-table[state: {state}, action: {action}, reward: {reward}]")
+        # Log for debugging (per-step, so skip formatting unless debugging is enabled).
+        if self.__logger__.isEnabledFor(DEBUG): self.__logger__.debug(f"Updating Q-table[state: {state}, action: {action}, reward: {reward}]")
+        
+        # Fetch state's action values once (each table access normalizes the state).
+        values: ndarray =   self._q_table_[state]
+        
+        # Bootstrap from best value of next state, unless episode has concluded.
+        future: float =     0.0 if done else self._q_table_.get_best_value(state = next_state)
         
         # Define new action-state value in Q-table.
-        self._q_table_[state][action] +=    (
-                                                self._learning_rate_ * (
-                                                    reward + (
-                                                            (self._discount_rate_ * 0) 
-                                                            if done 
-                                                            else self._q_table_.get_best_value(state = next_state)
-                                                    ) - self._q_table_[state][action]
-                                                )
-                                            )
+        values[action] +=   self._learning_rate_ * (reward + future - values[action])
         
     def save_config(self,
         path:   str
@@ -1,10 +1,23 @@
 """# ludorum.agents.q_learning.main"""
 
+from functools                  import cache
 from logging                    import Logger
 
 from agents.q_learning.commands import *
 from utilities                  import get_child
 
+@cache
+def _get_logger_() -> Logger:
+    """# Get Logger.
+    
+    Create the Q-Learning entry point's child logger on first use and reuse it thereafter (the root 
+    logger is not configured until the application driver runs, so it cannot be bound at import).
+
+    ## Returns:
+        * Logger:   Child logger of Q-Learning entry point.
+    """
+    return get_child(logger_name = "q-learning.main")
+
 def main(
     action: str,
     **kwargs
@@ -14,10 +27,8 @@ def main(
     ## Args:
         * action    (str):  Q-Learning action being executed.
     """
-    # Initialize logger.
-    _logger_:       Logger =            get_child(
-                                            logger_name =   "q-learning.main"
-                                        )
+    # Fetch logger.
+    _logger_:       Logger =            _get_logger_()
     
     # Define mapping of actions to their respective entry points.
     _actions_:  dict[str, callable] =   {
@@ -3,18 +3,22 @@
 Tis module handles the registration of the Q-Learning agent command argument parsers.
 """
 
-from argparse   import _SubParsersAction
+from typing     import TYPE_CHECKING
+
+if TYPE_CHECKING:   from utilities  import DeferredSubParsersAction
 
 def register_command_parsers(
-    parent_subparser:   _SubParsersAction
+    parent_subparser:   "DeferredSubParsersAction"
 ) -> None:
     """# Register Q-Learning Agent Command Parsers.
 
     ## Args:
-        * parent_subparser  (_SubParsersAction): Parent's sub-parsers object.
+        * parent_subparser  (DeferredSubParsersAction): Parent's sub-parsers object.
     """
-    # Deferred agent parser imports.
-    from agents.q_learning.commands.play    import register_play_parser
-
-    # Register agent parsers.
-    register_play_parser(parent_subparser =   parent_subparser)
\ No newline at end of file
+    # Register command parsers.
+    parent_subparser.defer_parser(
+        name =      "play",
+        help =      "Play a game.",
+        module =    "agents.q_learning.commands.play",
+        registrar = "register_play_parser"
+    )
\ No newline at end of file
@@ -38,11 +38,11 @@ def load_agent(
     ## Raises:
         * ValueError:   If agent is not registered.
     """
-    # If agent is not registered...
-    if name.lower() not in _REGISTRY_:
-        
-        # Report error.
-        raise ValueError(f"Invalid agent selection: {name}")
+    # Look up constructor.
+    try:                constructor:    Callable[..., Any] =    _REGISTRY_[name.lower()]
+    
+    # Report unregistered agent.
+    except KeyError:    raise ValueError(f"Invalid agent selection: {name}") from None
     
-    # Otherwise, load agent.
-    return _REGISTRY_[name.lower()](**kwargs)
\ No newline at end of file
+    # Load agent.
+    return constructor(**kwargs)
\ No newline at end of file
@@ -3,20 +3,32 @@
 This module handles the registration of environment parsers defines in sub-packages.
 """
 
-from argparse                   import  _SubParsersAction
+from typing     import TYPE_CHECKING
+
+if TYPE_CHECKING:   from utilities  import DeferredSubParsersAction
 
 def register_environment_parsers(
-    parent_subparser:   _SubParsersAction
+    parent_subparser:   "DeferredSubParsersAction"
 ) -> None:
     """# Register Environment Parsers.
+    
+    Environment parsers (and the environment packages that define them) are only loaded if their 
+    command is selected.
 
     ## Args:
-        * parent_subparser  (_SubParsersAction): Parent's sub-parsers object.
+        * parent_subparser  (DeferredSubParsersAction): Parent's sub-parsers object.
     """
-    # Deferred environment parser imports.
-    from environments.grid_world    import register_grid_world_parser
-    from environments.tic_tac_toe   import register_tic_tac_toe_parser
-    
     # Register environment parsers.
-    register_grid_world_parser(parent_subparser =   parent_subparser)
-    register_tic_tac_toe_parser(parent_subparser =  parent_subparser)
\ No newline at end of file
+    parent_subparser.defer_parser(
+        name =      "grid-world",
+        help =      "Grid World environment.",
+        module =    "environments.grid_world",
+        registrar = "register_grid_world_parser"
+    )
+    
+    parent_subparser.defer_parser(
+        name =      "tic-tac-toe",
+        help =      "Tic-Tac-Toe environment.",
+        module =    "environments.tic_tac_toe",
+        registrar = "register_tic_tac_toe_parser"
+    )
\ No newline at end of file
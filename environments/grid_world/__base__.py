@@ -3,13 +3,15 @@
 Grid World game implementation.
 """
 
-from typing                             import Any, Dict, List, override, Optional, Set, Tuple
+from typing                             import Any, Dict, List, Mapping, override, Optional, Set, Tuple
 
-from numpy                              import int32
+from numpy                              import array, int32
+from numpy.typing                       import NDArray
 
 from environments.__base__              import Environment
 from environments.grid_world.actions    import GridWorldActions
 from environments.grid_world.components import Grid
+from environments.grid_world.functional import GridWorldParams
 from spaces                             import Discrete, MultiDiscrete
 
 class GridWorld(Environment):
@@ -101,16 +103,20 @@ class GridWorld(Environment):
                                                                     episode.
         """
         # Initialize grid.
-        self._grid_:                Grid =              Grid(**{k: v for k, v in locals().items() if k != "self"})
+        self._grid_:                Grid =                          Grid(**{k: v for k, v in locals().items() if k != "self"})
         
         # Define actions.
-        self._actions_:             GridWorldActions =  GridWorldActions()
+        self._actions_:             GridWorldActions =              GridWorldActions()
+        
+        # Tabulate action deltas, as a plain tuple for single steps and an array for batched stepping.
+        self._deltas_:              Tuple[Tuple[int, int], ...] =   self._actions_.deltas
+        self._action_deltas_:       NDArray =                       array(self._deltas_, dtype = int32)
         
         # Define action space.
-        self._action_space_:        Discrete =          Discrete(n = 4)
+        self._action_space_:        Discrete =                      Discrete(n = 4)
         
         # Define observation space.
-        self._observation_space_:   MultiDiscrete =     MultiDiscrete(shape = (rows, columns))
+        self._observation_space_:   MultiDiscrete =                 MultiDiscrete(shape = (rows, columns))
         
     # PROPERTIES ===================================================================================
     
@@ -139,6 +145,23 @@ class GridWorld(Environment):
         """
         return "Grid World"
     
+    @property
+    def params(self) -> GridWorldParams:
+        """# (Grid World) Parameters
+
+        Static layout & rules of environment, for use with the stateless interface in 
+        `environments.grid_world.functional`.
+        """
+        return  GridWorldParams(
+                    kinds =             self.grid.kinds.copy(),
+                    values =            self.grid.values.copy(),
+                    exits =             self.grid.exits.copy(),
+                    start =             array(self.grid.start, dtype = int32),
+                    action_deltas =     self._action_deltas_.copy(),
+                    collision_penalty = self.grid.collision_penalty,
+                    wrapped =           self.grid.wrapped
+                )
+    
     @override
     @property
     def observation_space(self) -> int:
@@ -164,7 +187,7 @@ class GridWorld(Environment):
     @override
     def step(self,
         action: int
-    ) -> Tuple[float, int, bool, Dict[str, Any]]:
+    ) -> Tuple[float, int, bool, Mapping[str, Any]]:
         """# Step.
         
         Apply action to environment and return the result.
@@ -179,7 +202,36 @@ class GridWorld(Environment):
                 - bool:     Done flag indicating if the episode has ended
                 - Dict:     Additional information
         """
-        return self.grid.move(action = self._actions_[action]["delta"])
+        return self._grid_.move(action = self._deltas_[action])
+    
+    def step_batch(self,
+        positions:  NDArray,
+        actions:    NDArray,
+        collected:  Optional[NDArray] = None
+    ) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """# Step Batch.
+        
+        Apply one action to each of a batch of independent agents positioned within this 
+        environment's grid, without altering the environment's own state.
+        
+        ## Args:
+            * positions (NDArray):  Row, column coordinate of each agent, shaped (batch, 2).
+            * actions   (NDArray):  Action submitted by each agent, shaped (batch,).
+            * collected (NDArray):  Coins already collected by each agent, shaped (batch, rows, 
+                                    columns). Defaults to no coins collected.
+        
+        ## Returns:
+            * Tuple[NDArray, NDArray, NDArray, NDArray]:
+                - NDArray:  Next coordinate of each agent
+                - NDArray:  Reward received by each agent
+                - NDArray:  Done flag of each agent
+                - NDArray:  Coins collected by each agent
+        """
+        return  self.grid.move_batch(
+                    positions = positions,
+                    deltas =    self._action_deltas_[actions],
+                    collected = collected
+                )
     
     # DUNDERS ======================================================================================
     
@@ -188,7 +240,7 @@ class GridWorld(Environment):
 
         Object representation of environment.
         """
-        return f"<GridWorld(action_space = {self.action_space}, state_space = {self.state_space})>"
+        return f"<GridWorld(action_space = {self.action_space}, observation_space = {self.observation_space})>"
     
     def __str__(self) -> str:
         """# String Representation.
@@ -5,7 +5,7 @@ Defines actions available in Grid World environment.
 
 __all__ = ["GridWorldActions"]
 
-from typing import Dict, List, override, Tuple, Union
+from typing import Dict, Tuple, Union
 
 from spaces import Discrete
 
@@ -15,49 +15,43 @@ class GridWorldActions(Discrete):
     Discrete(n = 4) space representation of possible agent movements in 2D Grid World.
     """
     
+    # Attributes.
+    __slots__ = ("_deltas_", "_names_", "_symbols_")
+    
     def __init__(self):
         """# Instantiate Grid World Actions (Space)."""
         # Initialize space.
         super(GridWorldActions, self).__init__(n = 4)
         
-        # Define actions.
-        self._actions_: Dict[int, Dict[str, Union[str, Tuple[int, int]]]] = {
-                                                                                0:  {
-                                                                                        "name":     "up",
-                                                                                        "delta":    (-1, 0),
-                                                                                        "symbol":   "↑"
-                                                                                    },
-                                                                                1:  {
-                                                                                        "name":     "down",
-                                                                                        "delta":    (1, 0),
-                                                                                        "symbol":   "↓"
-                                                                                    },
-                                                                                2:  {
-                                                                                        "name":     "left",
-                                                                                        "delta":    (0, -1),
-                                                                                        "symbol":   "←"
-                                                                                    },
-                                                                                3:  {
-                                                                                        "name":     "right",
-                                                                                        "delta":    (0, 1),
-                                                                                        "symbol":   "→"
-                                                                                    }
-                                                                            }
+        # Define actions as flat tuples indexed by action, so that lookups avoid nested dictionaries.
+        self._deltas_:  Tuple[Tuple[int, int], ...] =   ((-1, 0), (1, 0), (0, -1), (0, 1))
+        self._names_:   Tuple[str, ...] =               ("up", "down", "left", "right")
+        self._symbols_: Tuple[str, ...] =               ("↑", "↓", "←", "→")
+        
+    # PROPERTIES ===================================================================================
+    
+    @property
+    def deltas(self) -> Tuple[Tuple[int, int], ...]:
+        """# (Action) Deltas
+
+        Row, column delta of each action, indexed by action.
+        """
+        return self._deltas_
         
     # METHODS ======================================================================================
     
     def get_delta(self,
         index:  int
-    ) -> str:
+    ) -> Tuple[int, int]:
         """# Get (Action) Delta.
 
         ## Args:
             * index (int):  Index of action whose delta is being fetched.
 
         ## Returns:
-            * str:  Action's delta.
+            * Tuple[int, int]:  Action's delta.
         """
-        return self[index]["delta"]
+        return self._deltas_[index]
     
     def get_name(self,
         index:  int
@@ -70,7 +64,7 @@ class GridWorldActions(Discrete):
         ## Returns:
             * str:  Action's name.
         """
-        return self[index]["name"]
+        return self._names_[index]
     
     def get_symbol(self,
         index:  int
@@ -83,7 +77,7 @@ class GridWorldActions(Discrete):
         ## Returns:
             * str:  Action's symbol.
         """
-        return self[index]["symbol"]
+        return self._symbols_[index]
     
     # DUNDERS ======================================================================================
     
@@ -95,11 +89,11 @@ class GridWorldActions(Discrete):
         ## Returns:
             * Dict[str, Union[str, Tuple[int, int]]]:   Action property mapping.
         """
-        return self._actions_[index]
+        return {"name": self._names_[index], "delta": self._deltas_[index], "symbol": self._symbols_[index]}
     
     def __len__(self) -> int:
         """# Actions Length
 
         Count of defined actions.
         """
-        return len(self._actions_)
\ No newline at end of file
+        return len(self._deltas_)
\ No newline at end of file
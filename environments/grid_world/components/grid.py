@@ -3,11 +3,33 @@
 Defines the basic greid component of Grid World.
 """
 
-from typing                                     import Any, Dict, List, Optional, Set, Tuple, Union
+from types                                      import MappingProxyType
+from typing                                     import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, Union
 
-from termcolor                                  import colored
+from numpy                                      import bool_, float64, full, int8, int32, zeros
+from numpy.typing                               import NDArray
 
+from environments.grid_world.components.kernels import move_batch
+from environments.grid_world.components.kinds   import BOUNDARY, COIN, EMPTY, GOAL, LOSS, PORTAL, WALL
 from environments.grid_world.components.squares import *
+from utilities                                  import colored
+
+def _metadata_(
+    event:  str
+) -> Mapping[str, Any]:
+    """# (Build Move) Metadata.
+
+    ## Args:
+        * event (str):  Event being reported.
+
+    ## Returns:
+        * Mapping[str, Any]:    Read-only metadata mapping, which can be shared by every move 
+                                reporting the same event.
+    """
+    return MappingProxyType({"event": event})
+
+# Metadata of re-entering a square whose coin was already collected.
+_REVISITED_COIN_:   Mapping[str, Any] = _metadata_(event = "landed on empty square")
 
 class Grid():
     """# (Grid World) Grid
@@ -101,13 +123,14 @@ class Grid():
         self._columns_:             int =                               columns
         self._rows_:                int =                               rows
         
-        # Define features.
-        self._coins_:               Set[Tuple[int, int]] =              coins
-        self._goal_:                Set[Tuple[int, int]] =              goal if goal is not None else {(self._rows_ - 1, self._columns_ - 1),}
-        self._loss_:                Set[Tuple[int, int]] =              loss
+        # Define features (coordinate sets are frozen once, so that membership tests are O(1) and 
+        # shared default arguments can never be mutated).
+        self._coins_:               FrozenSet[Tuple[int, int]] =        frozenset(map(tuple, coins))
+        self._goal_:                FrozenSet[Tuple[int, int]] =        frozenset(map(tuple, goal)) if goal is not None else frozenset({(self._rows_ - 1, self._columns_ - 1)})
+        self._loss_:                FrozenSet[Tuple[int, int]] =        frozenset(map(tuple, loss))
         self._portals_:             List[Dict[str, Tuple[int, int]]] =  portals
-        self._start_:               Tuple[int, int] =                   start
-        self._walls_:               Set[Tuple[int, int]] =              walls
+        self._start_:               Tuple[int, int] =                   tuple(start)
+        self._walls_:               FrozenSet[Tuple[int, int]] =        frozenset(map(tuple, walls))
         self._wrap_map_:            bool =                              wrap_map
         
         # Define rewards/penalties.
@@ -150,7 +173,7 @@ class Grid():
                                                             }
         
         # Flatten coordinates into a single set.
-        coordinates:    Set[Tuple[int, int]] =              set.union(*features.values())
+        coordinates:    Set[Tuple[int, int]] =              set().union(*features.values())
         
         # For each coordinate...
         for coordinate in coordinates:
@@ -184,7 +207,7 @@ class Grid():
         return self._coin_reward_
     
     @property
-    def coins(self) -> Set[Tuple[int, int]]:
+    def coins(self) -> FrozenSet[Tuple[int, int]]:
         """# Coins
 
         Set of coordinates at which coins are located.
@@ -208,7 +231,15 @@ class Grid():
         return self._columns_
     
     @property
-    def goal(self) -> Set[Tuple[int, int]]:
+    def exits(self) -> NDArray:
+        """# Exits
+
+        Exit coordinate of each portal square, shaped (rows, columns, 2). Read-only.
+        """
+        return self._exits_
+    
+    @property
+    def goal(self) -> FrozenSet[Tuple[int, int]]:
         """# Goal
         
         Set of coordinates at which goal squares are located.
@@ -224,7 +255,15 @@ class Grid():
         return self._goal_reward_
     
     @property
-    def loss(self) -> Set[Tuple[int, int]]:
+    def kinds(self) -> NDArray:
+        """# Kinds
+
+        Kind code of each square (see `components.kinds`), shaped (rows, columns). Read-only.
+        """
+        return self._kinds_
+    
+    @property
+    def loss(self) -> FrozenSet[Tuple[int, int]]:
         """# Loss
         
         Coordinates at which loss squares are located.
@@ -263,6 +302,14 @@ class Grid():
         """
         return self.rows, self.columns
     
+    @property
+    def start(self) -> Tuple[int, int]:
+        """# Start
+
+        Coordinate at which agent begins each episode.
+        """
+        return self._start_
+    
     @property
     def step_penalty(self) -> float:
         """# Step Penalty
@@ -272,7 +319,15 @@ class Grid():
         return self._step_penalty_
     
     @property
-    def walls(self) -> Set[Tuple[int, int]]:
+    def values(self) -> NDArray:
+        """# Values
+
+        Reward yielded/penalty incurred by entering each square, shaped (rows, columns). Read-only.
+        """
+        return self._values_
+    
+    @property
+    def walls(self) -> FrozenSet[Tuple[int, int]]:
         """# Walls
         
         Coordinates at which walls are located.
@@ -292,7 +347,7 @@ class Grid():
     
     def move(self,
         action: Tuple[int, int]
-    ) -> Tuple[float, Union[Tuple[int, int], int], bool, Dict[str, Any]]:
+    ) -> Tuple[float, Union[Tuple[int, int], int], bool, Mapping[str, Any]]:
         """# Move
         
         Update agent location and the state of the grid based on the action submitted by the agent.
@@ -301,47 +356,68 @@ class Grid():
             * action    (Tuple[int, int]):  Delta of action submitted.
 
         ## Returns:
-            * Tuple[float, Union[Tuple[int, int], int], bool, Dict[str, Any]]:
+            * Tuple[float, Union[Tuple[int, int], int], bool, Mapping[str, Any]]:
                 * Reward yielded/penalty incurred by action submitted.
                 * New state/coordinate location of agent after action was taken.
                 * True if agent has reached a terminal state.
-                * Metadata/information related to result of action.
+                * (Read-only) metadata/information related to result of action.
         """
-        # Compute resulting location.
-        new_coordinate: Tuple[int, int] =   (
-                                                self._agent_[0] + action[0],
-                                                self._agent_[1] + action[1]
-                                            )
-        
-        # If new coordinate is out of bounds...
-        if not self._is_in_bounds_(coordinate = new_coordinate):
+        # Look up outcome of entering destination in sentinel-padded table (border entries resolve 
+        # boundary collisions, or wrap around grid).
+        kind, value, square, destination, done, metadata =  self._outcomes_[self._agent_[0] + action[0] + 1][self._agent_[1] + action[1] + 1]
+        
+        # Record visitation of square entered (boundaries are not squares).
+        if square is not None:  self._visitations_[square[0]][square[1]] += 1
+        
+        # Coins yield their reward only once per episode, and the negative of it thereafter.
+        if kind == COIN:
             
-            # If map is not wrapped...
-            if not self.wrapped:
-                
-                # Return penalty for boundary collision.
-                return  self.collision_penalty, \
-                        self._agent_,           \
-                        False,                  \
-                        {"event": "collided with boundary"}
-                        
-            # Otherwise, modulate new coordinate based on dimensions.
-            new_coordinate: Tuple[int, int] =   (
-                                                    new_coordinate[0] % self.rows,
-                                                    new_coordinate[1] % self.columns
-                                                )
+            # Coin was already collected.
+            if self._collected_[square[0]][square[1]]:  value, metadata =                           -value, _REVISITED_COIN_
             
-        # Interact with square.
-        value, state, done, metadata =      self._get_square_(coordinate = new_coordinate).interact()
+            # Otherwise, collect coin.
+            else:                                       self._collected_[square[0]][square[1]] =    True
         
-        # Update agent location.
-        self._agent_:   Tuple[int, int] =   state if state is not None else self._agent_
+        # Walls & boundaries leave agent in place.
+        if destination is not None: self._agent_:  Tuple[int, int] =   destination
+        
+        # Return outcome.
+        return value, self._agent_, done, metadata
             
-        # Return result of action.
-        return  value,          \
-                self._agent_,   \
-                done,           \
-                metadata
+    def move_batch(self,
+        positions:  NDArray,
+        deltas:     NDArray,
+        collected:  Optional[NDArray] = None
+    ) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """# Move Batch
+        
+        Advance a batch of independent agents over this grid's layout in a single vectorized pass. 
+        The grid's own agent, coins, and visitation counts are left untouched.
+
+        ## Args:
+            * positions (NDArray):  Row, column coordinate of each agent, shaped (batch, 2).
+            * deltas    (NDArray):  Row, column delta of each agent's action, shaped (batch, 2).
+            * collected (NDArray):  Coins already collected by each agent, shaped (batch, rows, 
+                                    columns). Defaults to no coins collected.
+
+        ## Returns:
+            * Tuple[NDArray, NDArray, NDArray, NDArray]:
+                * Coordinate of each agent after action was taken.
+                * Reward yielded/penalty incurred by each action.
+                * True for each agent that has reached a terminal state.
+                * Coins collected by each agent after action was taken.
+        """
+        return  move_batch(
+                    positions =         positions,
+                    deltas =            deltas,
+                    kinds =             self._kinds_,
+                    values =            self._values_,
+                    exits =             self._exits_,
+                    collected =         collected if collected is not None 
+                                        else zeros((len(positions), self.rows, self.columns), dtype = bool_),
+                    collision_penalty = self.collision_penalty,
+                    wrapped =           self.wrapped
+                )
             
     def reset(self) -> int:
         """# Reset.
@@ -351,11 +427,9 @@ class Grid():
         ## Returns:
             * int: Agent's starting location.
         """
-        # For each row...
-        for row in self._grid_: 
-            
-            # Reset each square in row.
-            for square in row: square.reset()
+        # Reset square states.
+        self._collected_:   List[List[bool]] =  [[False] * self._columns_ for _ in range(self._rows_)]
+        self._visitations_: List[List[int]] =   [[0]     * self._columns_ for _ in range(self._rows_)]
             
         # Reset agent.
         self._agent_:   Tuple[int, int] =   self._start_
@@ -383,7 +457,8 @@ class Grid():
     ) -> Square:
         """# Get Square.
         
-        Fetch square at specified coordinate.
+        Fetch square at specified coordinate. The square is a snapshot assembled from the grid's 
+        arrays; it does not track subsequent moves.
 
         ## Args:
             * coordinate    (Tuple[int, int]):  Row, column coordinate of square being fetched.
@@ -394,8 +469,44 @@ class Grid():
         # Assert that coordinate provided is valid.
         assert self._is_in_bounds_(coordinate = coordinate), f"Coordinates provided are out of bounds"
         
+        # Unpack coordinate.
+        r, c =                  coordinate
+        
+        # Read square's value.
+        value:  float =         float(self._values_[r, c])
+        
+        # Read kind of square.
+        kind:   int =           int(self._kinds_[r, c])
+        
+        # Goal.
+        if   kind == GOAL:      square: Square =    Goal(row = r, column = c, value = value)
+        
+        # Loss.
+        elif kind == LOSS:      square: Square =    Loss(row = r, column = c, value = value)
+        
+        # Coin.
+        elif kind == COIN:
+            
+            # Instantiate coin.
+            square: Square =                        Coin(row = r, column = c, value = value)
+            
+            # Reflect whether it has been collected.
+            square._collected_: bool =              self._collected_[r][c]
+        
+        # Wall.
+        elif kind == WALL:      square: Square =    Wall(row = r, column = c, value = value)
+        
+        # Portal.
+        elif kind == PORTAL:    square: Square =    Portal(row = r, column = c, exit = tuple(self._exits_[r, c].tolist()), value = value)
+        
+        # Empty.
+        else:                   square: Square =    Square(row = r, column = c, value = value)
+            
+        # Reflect visitations.
+        square._visitations_:   int =           self._visitations_[r][c]
+        
         # Return requested square.
-        return self._grid_[coordinate[0]][coordinate[1]]
+        return square
     
     def _is_in_bounds_(self,
         coordinate: Tuple[int, int]
@@ -415,30 +526,112 @@ class Grid():
         
         Populate grid with squares of types specified by feature parametters.
         """
-        # Instantiate grid of empty squares.
-        self._grid_:    List[List[Square]] =    [
-                                                    [
-                                                        Square(row = r, column = c, value = self.step_penalty)
-                                                        for c in range(self.columns)
-                                                    ]   for r in range(self.rows)
-                                                ]
+        # Initialize square kinds & values (every square starts empty).
+        self._kinds_:       NDArray =   full((self.rows, self.columns), EMPTY, dtype = int8)
+        self._values_:      NDArray =   full((self.rows, self.columns), self.step_penalty, dtype = float64)
+        
+        # Initialize portal exits.
+        self._exits_:       NDArray =   zeros((self.rows, self.columns, 2), dtype = int32)
+        
+        # Initialize square states (plain lists, since they are updated one square at a time).
+        self._collected_:   List[List[bool]] =  [[False] * self.columns for _ in range(self.rows)]
+        self._visitations_: List[List[int]] =   [[0]     * self.columns for _ in range(self.rows)]
         
         # Populate features.
-        for r, c in self.goal:  self._grid_[r][c] =   Goal(row = r, column = c, value = self.goal_reward)
-        for r, c in self.loss:  self._grid_[r][c] =   Loss(row = r, column = c, value = self.loss_penalty)
-        for r, c in self.coins: self._grid_[r][c] =   Coin(row = r, column = c, value = self.coin_reward)
-        for r, c in self.walls: self._grid_[r][c] =   Wall(row = r, column = c, value = self.collision_penalty)
+        for r, c in self.goal:  self._kinds_[r, c], self._values_[r, c] =   GOAL, self.goal_reward
+        for r, c in self.loss:  self._kinds_[r, c], self._values_[r, c] =   LOSS, self.loss_penalty
+        for r, c in self.coins: self._kinds_[r, c], self._values_[r, c] =   COIN, self.coin_reward
+        for r, c in self.walls: self._kinds_[r, c], self._values_[r, c] =   WALL, self.collision_penalty
         
         # For each portal...
         for portal in self.portals:
             
-            # Instantiate portal entry.
-            self._grid_[portal["entry"][0]][portal["entry"][1]] = Portal(
-                                                                    row =       portal["entry"][0],
-                                                                    column =    portal["entry"][1],
-                                                                    exit =      portal["exit"],
-                                                                    value =     self.step_penalty
-                                                                )
+            # Mark portal entry & record its exit.
+            self._kinds_[portal["entry"]] =     PORTAL
+            self._exits_[portal["entry"]] =     portal["exit"]
+            
+        # Tabulate the outcome of entering every square, padded by one square on each side so that 
+        # single-agent moves resolve bounds, walls, portals, & terminals with a single lookup.
+        self._outcomes_:    List[List[Tuple]] =             [
+                                                                [
+                                                                    self._resolve_outcome_(row = r, column = c)
+                                                                    for c in range(-1, self.columns + 1)
+                                                                ]
+                                                                for r in range(-1, self.rows + 1)
+                                                            ]
+        
+        # Render each square's (static) glyph once, along with agent's.
+        self._glyph_table_: List[List[str]] =               [
+                                                                [str(self._get_square_(coordinate = (r, c))) for c in range(self.columns)]
+                                                                for r in range(self.rows)
+                                                            ]
+        self._agent_glyph_: str =                           colored("A", color = "blue")
+        
+        # Frame depends only on dimensions, so it is drawn once here rather than on every render.
+        self._column_index_:    str =   (" " * 4) + " ".join(f" {column} " for column in range(self.columns))
+        self._top_border_:      str =   "\n   ┌" + ((("─" * 3) + "┬") * (self.columns - 1)) + ("─" * 3) + "┐"
+        self._middle_line_:     str =   "\n   ├" + ((("─" * 3) + "┼") * (self.columns - 1)) + ("─" * 3) + "┤"
+        self._bottom_border_:   str =   "\n   └" + ((("─" * 3) + "┴") * (self.columns - 1)) + ("─" * 3) + "┘"
+            
+    def _resolve_outcome_(self,
+        row:    int,
+        column: int
+    ) -> Tuple[int, float, Optional[Tuple[int, int]], Optional[Tuple[int, int]], bool, Mapping[str, Any]]:
+        """# Resolve Outcome.
+        
+        Resolve the (static) outcome of an agent attempting to enter the specified coordinate, which 
+        may lie one square beyond the grid's boundaries.
+
+        ## Args:
+            * row       (int):  Row being entered.
+            * column    (int):  Column being entered.
+
+        ## Returns:
+            * Tuple[int, float, Tuple[int, int] | None, Tuple[int, int] | None, bool, Mapping[str, Any]]:
+                * Kind of square entered.
+                * Reward yielded/penalty incurred by entering it.
+                * Coordinate of square entered, or None if it lies beyond boundary.
+                * Coordinate at which agent lands, or None if agent stays put.
+                * True if square is terminal.
+                * (Read-only) metadata reported for entering square.
+        """
+        # Coordinates beyond boundary wrap around grid if map is wrapped.
+        if self.wrapped:    row, column =   row % self.rows, column % self.columns
+        
+        # Otherwise, agent collides with boundary.
+        elif not self._is_in_bounds_(coordinate = (row, column)):
+            
+            # Report collision.
+            return BOUNDARY, self.collision_penalty, None, None, False, _metadata_(event = "collided with boundary")
+        
+        # Read kind & value of square.
+        square: Tuple[int, int] =   (row, column)
+        kind:   int =               int(self._kinds_[square])
+        value:  float =             float(self._values_[square])
+        
+        # Wall.
+        if kind == WALL:    return kind, value, square, None, False, _metadata_(event = "collided with wall")
+        
+        # Portal.
+        if kind == PORTAL:
+            
+            # Read portal's exit.
+            exit_:  Tuple[int, int] =   tuple(self._exits_[square].tolist())
+            
+            # Agent is transported to exit.
+            return kind, value, square, exit_, False, _metadata_(event = f"entered portal to {exit_}")
+        
+        # Goal.
+        if kind == GOAL:    return kind, value, square, square, True, _metadata_(event = "won (reached goal square)")
+        
+        # Loss.
+        if kind == LOSS:    return kind, value, square, square, True, _metadata_(event = "lost (reached loss square)")
+        
+        # Coin.
+        if kind == COIN:    return kind, value, square, square, False, _metadata_(event = "collected a coin")
+        
+        # Empty.
+        return kind, value, square, square, False, _metadata_(event = "landed on empty square")
             
     # DUNDERS ======================================================================================
     
@@ -454,29 +647,27 @@ class Grid():
         
         String rendering of grid.
         """
-        # Predefine border and index strings.
-        column_index:   str =   (" " * 4) + " ".join(f" {column} " for column in range(self.columns))
-        top_border:     str =   "\n   ┌" + ((("─" * 3) + "┬") * (self.columns - 1)) + ("─" * 3) + "┐"
-        middle_line:    str =   "\n   ├" + ((("─" * 3) + "┼") * (self.columns - 1)) + ("─" * 3) + "┤"
-        bottom_border:  str =   "\n   └" + ((("─" * 3) + "┴") * (self.columns - 1)) + ("─" * 3) + "┘"
-        
-        # Initialize grid string to which rendering will be appended.
-        grid_string:    str =   column_index + top_border
+        # Initialize fragments with precomputed frame, which will be joined once rendering is complete.
+        parts:  List[str] = [self._column_index_, self._top_border_]
         
         # For each row in grid...
-        for r, row in enumerate(self._grid_):
+        for r in range(self.rows):
             
             # Start new row with index.
-            grid_string     += f"\n {r} │"
+            parts.append(f"\n {r} │")
             
             # For each square in row...
-            for c, square in enumerate(row):
+            for c in range(self.columns):
                 
-                # Append square or agent symbol.
-                grid_string += f""" {colored("A", color= "blue") if self._agent_ == (r, c) else square} │"""
+                # Append agent symbol, blank for collected coins, or square's precomputed glyph.
+                parts.append(
+                    f" {self._agent_glyph_} │"  if self._agent_ == (r, c)   else
+                    "   │"                      if self._collected_[r][c]   else
+                    f" {self._glyph_table_[r][c]} │"
+                )
                 
             # Append row separator or bottom border.
-            grid_string     += middle_line if r != self.rows - 1 else bottom_border
+            parts.append(self._middle_line_ if r != self.rows - 1 else self._bottom_border_)
                                         
         # Return grid representation.
-        return grid_string
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
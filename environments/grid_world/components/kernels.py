@@ -0,0 +1,87 @@
+"""# ludorum.environments.grid_world.components.kernels
+
+This module provides vectorized kernels that advance batches of independent Grid World agents over
+a shared grid layout, recorded as (rows, columns) arrays of square kinds, values, and portal exits.
+"""
+
+__all__ =   [
+                "move_batch"
+            ]
+
+from typing                                     import Tuple
+
+from numpy                                      import arange, bool_, where, zeros
+from numpy.typing                               import NDArray
+
+from environments.grid_world.components.kinds   import COIN, GOAL, LOSS, PORTAL, WALL
+
+def move_batch(
+    positions:          NDArray,
+    deltas:             NDArray,
+    kinds:              NDArray,
+    values:             NDArray,
+    exits:              NDArray,
+    collected:          NDArray,
+    collision_penalty:  float,
+    wrapped:            bool
+) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+    """# Move Batch.
+
+    Apply one movement to each of a batch of independent agents, without mutating the arrays
+    provided.
+
+    ## Args:
+        * positions         (NDArray):  Row, column coordinate of each agent, shaped (batch, 2).
+        * deltas            (NDArray):  Row, column delta of each movement, shaped (batch, 2).
+        * kinds             (NDArray):  Kind of each square, shaped (rows, columns).
+        * values            (NDArray):  Value of each square, shaped (rows, columns).
+        * exits             (NDArray):  Exit of each portal square, shaped (rows, columns, 2).
+        * collected         (NDArray):  Coins already collected in each episode, shaped (batch,
+                                        rows, columns).
+        * collision_penalty (float):    Penalty incurred for colliding with grid boundary.
+        * wrapped           (bool):     If true, agents crossing a boundary appear on the opposite
+                                        side of the grid.
+
+    ## Returns:
+        * Tuple[NDArray, NDArray, NDArray, NDArray]:
+            - NDArray:  Coordinate of each agent after moving.
+            - NDArray:  Reward yielded/penalty incurred by each movement.
+            - NDArray:  Done flag of each agent.
+            - NDArray:  Coins collected in each episode after moving.
+    """
+    # Compute resulting locations.
+    rows, columns =         kinds.shape
+    batch:      NDArray =   arange(positions.shape[0])
+    new:        NDArray =   positions + deltas
+
+    # If map is wrapped, modulate locations based on dimensions (no boundary can be crossed).
+    if wrapped:
+        
+        new:    NDArray =   new % (rows, columns)
+        oob:    NDArray =   zeros(positions.shape[0], dtype = bool_)
+        
+    # Otherwise, flag locations that crossed a boundary.
+    else:       oob:    NDArray =   (new[:, 0] < 0) | (new[:, 0] >= rows) | (new[:, 1] < 0) | (new[:, 1] >= columns)
+
+    # Clamp locations so that squares can be read for every agent (out-of-bounds results are masked).
+    r:          NDArray =   new[:, 0].clip(0, rows    - 1)
+    c:          NDArray =   new[:, 1].clip(0, columns - 1)
+
+    # Read kind & value of destination squares.
+    kind:       NDArray =   where(oob, WALL, kinds[r, c])
+    value:      NDArray =   where(oob, collision_penalty, values[r, c])
+
+    # Coins that have already been collected yield the negative of their reward.
+    coin:       NDArray =   kind == COIN
+    value:      NDArray =   where(coin & collected[batch, r, c], -value, value)
+
+    # Record newly collected coins.
+    collected:  NDArray =   collected.copy()
+    collected[batch[coin], r[coin], c[coin]] =  True
+
+    # Agents stay put on collisions, and are transported to exits by portals.
+    moved:      NDArray =   where((kind == WALL)[:, None], positions, new)
+    moved:      NDArray =   where((kind == PORTAL)[:, None], exits[r, c], moved)
+
+    # Return results.
+    return moved, value, (kind == GOAL) | (kind == LOSS), collected
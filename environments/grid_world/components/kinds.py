@@ -0,0 +1,25 @@
+"""# ludorum.environments.grid_world.components.kinds
+
+Defines the integer codes with which square kinds are recorded in the grid's arrays.
+"""
+
+__all__ =   [
+                "BOUNDARY",
+                "COIN",
+                "EMPTY",
+                "GOAL",
+                "LOSS",
+                "PORTAL",
+                "WALL"
+            ]
+
+# Square kinds.
+EMPTY:      int =   0
+GOAL:       int =   1
+LOSS:       int =   2
+COIN:       int =   3
+WALL:       int =   4
+PORTAL:     int =   5
+
+# Sentinel kind of the (virtual) squares surrounding an unwrapped grid.
+BOUNDARY:   int =   6
@@ -5,9 +5,11 @@ Defines the coin square component of the Grid World grid.
 
 from typing                                                 import Any, Dict, override, Optional, Tuple
 
-from termcolor                                              import colored
-
 from environments.grid_world.components.squares.__base__    import Square
+from utilities                                              import colored
+
+# Precomputed (uncollected) glyph.
+_GLYPH_:    str =   colored(text = "$", color = "yellow")
 
 class Coin(Square):
     """# (Grid World) Coin
@@ -117,4 +119,4 @@ class Coin(Square):
         ## Returns:
             * str:  Glyph representation of Square.
         """
-        return " " if self.collected else colored(text = "$", color = "yellow")
\ No newline at end of file
+        return " " if self.collected else _GLYPH_
\ No newline at end of file
@@ -5,9 +5,11 @@ Defines the goal square component of the Grid World grid.
 
 from typing                                                 import Any, Dict, override, Optional, Tuple
 
-from termcolor                                              import colored
-
 from environments.grid_world.components.squares.__base__    import Square
+from utilities                                              import colored
+
+# Precomputed glyph.
+_GLYPH_:    str =   colored(text = "◯", color = "green")
 
 class Goal(Square):
     """# (Grid World) Goal
@@ -61,7 +63,7 @@ class Goal(Square):
         ## Returns:
             * str:  Object representation of Square.
         """
-        return f"<Loss(row = {self.row}, column = {self.column})>"
+        return f"<Goal(row = {self.row}, column = {self.column})>"
     
     @override
     def __str__(self) -> str:
@@ -70,4 +72,4 @@ class Goal(Square):
         ## Returns:
             * str:  Glyph representation of Square.
         """
-        return colored(text = "◯", color = "green")
\ No newline at end of file
+        return _GLYPH_
\ No newline at end of file
@@ -5,9 +5,11 @@ Defines the loss square component of the Grid World grid.
 
 from typing                                                 import Any, Dict, override, Optional, Tuple
 
-from termcolor                                              import colored
-
 from environments.grid_world.components.squares.__base__    import Square
+from utilities                                              import colored
+
+# Glyph, rendered once at import.
+_GLYPH_:    str =   colored(text = "◯", color = "red")
 
 class Loss(Square):
     """# (Grid World) Loss
@@ -70,4 +72,4 @@ class Loss(Square):
         ## Returns:
             * str:  Glyph representation of Square.
         """
-        return colored(text = "◯", color = "red")
\ No newline at end of file
+        return _GLYPH_
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""# ludorum.environments.grid_world.functional
+
+Stateless interface to Grid World dynamics. Static layout is captured once in `GridWorldParams`,
+while every mutable quantity is carried in an immutable `GridWorldState`, such that transitions are
+pure functions of (params, state, action). All state fields carry a leading batch dimension, so
+many episodes can be advanced together. Parameters are obtained from `GridWorld.params`.
+"""
+
+__all__ =   [
+                "GridWorldParams",
+                "GridWorldState",
+                "reset",
+                "step"
+            ]
+
+from typing                                     import NamedTuple, Tuple
+
+from numpy                                      import bool_, int32, tile, zeros
+from numpy.typing                               import NDArray
+
+from environments.grid_world.components.kernels import move_batch
+
+class GridWorldParams(NamedTuple):
+    """# Grid World Parameters
+
+    Static layout & rules of a Grid World environment.
+    """
+    kinds:              NDArray
+    values:             NDArray
+    exits:              NDArray
+    start:              NDArray
+    action_deltas:      NDArray
+    collision_penalty:  float
+    wrapped:            bool
+
+class GridWorldState(NamedTuple):
+    """# Grid World State
+
+    Mutable quantities of a batch of Grid World episodes.
+    """
+    positions:          NDArray
+    collected:          NDArray
+    t:                  NDArray
+
+def reset(
+    params: GridWorldParams,
+    batch:  int =   1
+) -> GridWorldState:
+    """# Reset.
+
+    ## Args:
+        * params    (GridWorldParams):  Static parameters of environment.
+        * batch     (int):              Number of episodes being initialized. Defaults to 1.
+
+    ## Returns:
+        * GridWorldState:   Initial state of each episode.
+    """
+    return  GridWorldState(
+                positions = tile(params.start, (batch, 1)),
+                collected = zeros((batch,) + params.kinds.shape, dtype = bool_),
+                t =         zeros(batch, dtype = int32)
+            )
+
+def step(
+    params:     GridWorldParams,
+    state:      GridWorldState,
+    actions:    NDArray
+) -> Tuple[GridWorldState, NDArray, NDArray]:
+    """# Step.
+
+    Apply one action to each episode. Neither the parameters nor the state provided are mutated.
+
+    ## Args:
+        * params    (GridWorldParams):  Static parameters of environment.
+        * state     (GridWorldState):   Current state of each episode.
+        * actions   (NDArray):          Action submitted in each episode, shaped (batch,).
+
+    ## Returns:
+        * Tuple[GridWorldState, NDArray, NDArray]:
+            - GridWorldState:   Next state of each episode.
+            - NDArray:          Reward yielded/penalty incurred in each episode.
+            - NDArray:          Done flag of each episode.
+    """
+    # Advance each episode.
+    positions, rewards, dones, collected =  move_batch(
+                                                positions =         state.positions,
+                                                deltas =            params.action_deltas[actions],
+                                                kinds =             params.kinds,
+                                                values =            params.values,
+                                                exits =             params.exits,
+                                                collected =         state.collected,
+                                                collision_penalty = params.collision_penalty,
+                                                wrapped =           params.wrapped
+                                            )
+
+    # Return results.
+    return GridWorldState(positions = positions, collected = collected, t = state.t + 1), rewards, dones
@@ -38,11 +38,11 @@ def load_environment(
     ## Raises:
         * ValueError:   If environment is not registered.
     """
-    # If environment is not registered...
-    if name.lower() not in _REGISTRY_:
-        
-        # Report error.
-        raise ValueError(f"Invalid environment selection: {name}")
+    # Look up constructor.
+    try:                constructor:    Callable[..., Any] =    _REGISTRY_[name.lower()]
+    
+    # Report unregistered environment.
+    except KeyError:    raise ValueError(f"Invalid environment selection: {name}") from None
     
-    # Otherwise, load environment.
-    return _REGISTRY_[name.lower()](**kwargs)
\ No newline at end of file
+    # Load environment.
+    return constructor(**kwargs)
\ No newline at end of file
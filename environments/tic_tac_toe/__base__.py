@@ -3,18 +3,19 @@
 Tic-Tac-Toe environment interface.
 """
 
-from random                                     import choice
-from typing                                 import Any, Dict, List, override, Optional, Tuple, Union
+from typing                                 import Any, Dict, List, override, Optional, Tuple, TYPE_CHECKING, Union
 
 from numpy                                  import int8
 from numpy.typing                           import NDArray
-from torch                                  import Tensor
 
 from agents                                 import Agent
 from environments.__base__                  import Environment
 from environments.tic_tac_toe.components    import Board
 from spaces                                 import Box, Discrete
 
+# Annotation only; board tensors import torch on demand.
+if TYPE_CHECKING:   from torch              import Tensor
+
 class TicTacToe(Environment):
     """# Tic-Tac-Toe (Environment)
     
@@ -102,7 +103,7 @@ class TicTacToe(Environment):
         return self._observation_space_
     
     @property
-    def tensor(self) -> Tensor:
+    def tensor(self) -> "Tensor":
         """# (Board) to Tensor.
 
         One-hot encoded tensor of board state.
@@ -149,7 +150,7 @@ class TicTacToe(Environment):
             case _:             raise TypeError(f"Action expected to be integer or coordinate, got {type(action)}")
             
         # If game is not over, opponent takes turn.
-        if not done: self._board_.make_move_by_action(action = choice(self._board_.valid_actions))
+        if not done: self._board_.make_move_by_action(action = self._board_.sample_valid_action())
         
         # Return actin results.
         return reward, state, done, info
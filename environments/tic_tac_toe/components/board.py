@@ -5,18 +5,22 @@ This module defines the Tic-Tac-Toe board component structure and validation ope
 
 __all__ = ["Board"]
 
-from typing                                     import Any, Dict, List, Optional, Tuple
+from typing                                     import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from numpy                                      import array
-from numpy.typing                               import NDArray
-from torch                                      import stack, Tensor
+from numpy                                          import int8, uint8, uint64, zeros
+from numpy.random                                   import default_rng, Generator
+from numpy.typing                                   import NDArray
 
-from environments.tic_tac_toe.components.cell   import Cell
+from environments.tic_tac_toe.components.kernels    import line_indices, valid_actions
+from environments.tic_tac_toe.components.players    import Player
+
+# Annotation only; torch is imported when a tensor is first requested.
+if TYPE_CHECKING:   from torch                      import Tensor
 
 class Board():
     """# (Tic-Tac-Toe) Board
     
-    Manages a 2D matrix of grid cells and manages game rules.
+    Manages a flat array of grid cells (row-major order) and manages game rules.
     """
     
     def __init__(self,
@@ -52,6 +56,33 @@ class Board():
         self._draw_penalty_:    float = draw_penalty
         self._step_penalty_:    float = step_penalty
         
+        # Initialize random number generator (for sampling valid actions).
+        self._rng_:             Generator = default_rng()
+        
+        # Derive bit mask of each winning line (fixed for the life of the board).
+        self._line_masks_:      Tuple[int, ...] =               tuple(sum(1 << index for index in line) for line in line_indices(size = self._size_).tolist())
+        
+        # Map each cell to the masks of the lines passing through it.
+        self._cell_masks_:      Tuple[Tuple[int, ...], ...] =   tuple(
+                                                                    tuple(mask for mask in self._line_masks_ if mask >> index & 1)
+                                                                    for index in range(self._size_ ** 2)
+                                                                )
+        
+        # Generate Zobrist key of each cell for each player (seeded, so that equal positions on 
+        # different boards share a hash).
+        self._zobrist_keys_:    Tuple[Tuple[int, int], ...] =   tuple(
+                                                                    map(tuple, default_rng(0).integers(
+                                                                        low =   0,
+                                                                        high =  2 ** 63,
+                                                                        size =  (self._size_ ** 2, 2),
+                                                                        dtype = uint64
+                                                                    ).tolist())
+                                                                )
+        
+        # Predefine column index & separation line for rendering.
+        self._header_:          str =   "   " + " ".join(f" {column} " for column in range(self._size_))
+        self._separator_:       str =   "   " + ("───┼" * (self._size_ - 1)) + ("─" * 3)
+        
         # Populate grid.
         self._populate_grid_()
         
@@ -63,7 +94,7 @@ class Board():
 
         One-hot encoded array of board state.
         """
-        return self.tensor.numpy()
+        return self._onehot_.copy()
     
     @property
     def has_winner(self) -> bool:
@@ -87,7 +118,7 @@ class Board():
 
         True if there are no empty cells in grid.
         """
-        return all(not cell.is_empty for row in self._grid_ for cell in row)
+        return self._empty_count_ == 0
     
     @property
     def is_over(self) -> bool:
@@ -98,14 +129,15 @@ class Board():
         return self.has_winner or self.is_draw
     
     @property
-    def tensor(self) -> Tensor:
+    def tensor(self) -> "Tensor":
         """# (Board) to Tensor.
 
-        One-hot encoded tensor of board state.
+        One-hot encoded tensor of board state. This is a zero-copy view that shares memory with the 
+        board and reflects subsequent moves; treat it as read-only, and clone it to keep a snapshot.
         """
-        return  stack(
-                    [cell.onehot for row in self._grid_ for cell in row]
-                ).reshape((self._size_, self._size_, 3), -1)
+        from torch  import from_numpy
+        
+        return from_numpy(self._onehot_)
         
     @property
     def valid_actions(self) -> List[int]:
@@ -113,34 +145,23 @@ class Board():
 
         List of actions that are valid given current board state.
         """
-        return [a for a in range(self._size_ ** 2) if self._action_is_valid_(a)]
+        return self._legal_actions_().tolist()
     
     @property
     def winner(self) -> Optional[int]:
         """# (Game) Winner
         
-        Game winner, if a player has won the game.
+        Game winner, if a player has won the game. Maintained incrementally as moves are made.
         """
-        # Initialize lines for validation.
-        lines:  List[List[Cell]] =  [[self._grid_[r][c] for c in range(self._size_)] for r in range(self._size_)]   +\
-                                    [[self._grid_[c][r] for c in range(self._size_)] for r in range(self._size_)]   +\
-                                    [[self._grid_[i][i] for i in range(self._size_)]]                               +\
-                                    [[self._grid_[i][self._size_ - i - 1] for i in range(self._size_)]]
-        
-        # For each line...
-        for line in lines:
-            
-            # Compute sum of line.
-            total:  int =   sum(cell.player for cell in line)
-                
-            # Player wins.
-            if total ==  self._size_:   return 1
-                
-            # Opponent wins.
-            if total == -self._size_:   return -1
-                
-        # No winner found.
-        return None
+        return self._winner_
+    
+    @property
+    def zobrist(self) -> int:
+        """# (Board) Zobrist Hash
+
+        64-bit hash of current position, maintained incrementally as moves are made.
+        """
+        return self._hash_
         
     # METHODS ======================================================================================
         
@@ -173,17 +194,37 @@ class Board():
                         {"event": "attempted invalid move"}
             )
         
-        # Otherwise, mark cell.
-        self._grid_[row][column].mark(player = self._current_player_)
+        # Otherwise, locate cell & current player's side (0 for player, 1 for opponent).
+        index:  int =   self._coordinate_to_state_(row = row, column = column)
+        side:   int =   0 if self._current_player_ == 1 else 1
+        
+        # Mark cell.
+        self._grid_[index] =            self._current_player_
+        self._bitboards_[side]  |=      1 << index
+        self._hash_             ^=      self._zobrist_keys_[index][side]
+        self._empty_count_      -=      1
+        
+        # Board changed, so legal actions must be located again.
+        self._legal_ =                  None
+        
+        # Move one-hot encoding of cell from empty channel to player's channel.
+        self._onehot_[row, column] =                                0
+        self._onehot_[row, column, self._current_player_ % 3] =     1
+        
+        # Only lines passing through this cell can have been completed.
+        self._check_winner_from_(index = index)
         
         # Switch players.
         self._switch_player_()
         
+        # Evaluate move.
+        reward, done =  self._finalize_move_()
+        
         # Return results.
         return  (
-                    self._evaluate_move_(),
+                    reward,
                     self.array,
-                    self.is_over,
+                    done,
                     {"event": f"made move at ({row}, {column})"}
                 )
         
@@ -217,17 +258,36 @@ class Board():
         ## Returns:
             * ndarray:  State of board after reset.
         """
-        # For each row...
-        for row in self._grid_:
-            
-            # Reset each cell in row.
-            for cell in row: cell.reset()
+        # Clear all cells.
+        self._grid_.fill(0)
+        self._onehot_.fill(0)
+        self._onehot_[:, :, 0] =    1
+        self._bitboards_:       List[int] =         [0, 0]
+        self._empty_count_:     int =               self._size_ ** 2
+        self._legal_:           Optional[NDArray] = None
+        self._hash_:            int =               0
+        self._winner_:          Optional[int] =     None
             
         # Reset current player.
         self._current_player_:  int =   1
         
         # Return board state.
         return self.to_ndarray()
+    
+    def sample_valid_action(self) -> int:
+        """# Sample Valid Action.
+        
+        Randomly select one of the actions that are valid given current board state, without 
+        materializing the list of valid actions.
+
+        ## Returns:
+            * int:  Randomly selected valid action.
+        """
+        # Locate legal actions.
+        legal:  NDArray =   self._legal_actions_()
+        
+        # Select one at random.
+        return int(legal[self._rng_.integers(len(legal))])
         
     def to_ndarray(self) -> NDArray:
         """# (Board) to NDArray.
@@ -235,7 +295,7 @@ class Board():
         ## Returns:
             * ndarray:  2D array representation of current board state.
         """
-        return array([[cell.player for cell in row] for row in self._grid_])
+        return self._grid_.reshape(self._size_, self._size_).copy()
         
     # HELPERS ======================================================================================
     
@@ -255,6 +315,22 @@ class Board():
                     column =    action %  self._size_
                 )
     
+    def _check_winner_from_(self,
+        index:  int
+    ) -> None:
+        """# Check Winner from (Cell).
+        
+        Record the current player as the winner if their last move, at the cell provided, completed 
+        a line. A winner, once recorded, is never replaced by moves made after the game was won.
+
+        ## Args:
+            * index (int):  Index of cell in which current player's last move was made.
+        """
+        if  self._winner_ is None and self._has_won_(
+                bitboard =  self._bitboards_[0 if self._current_player_ == 1 else 1],
+                index =     index
+            ):  self._winner_:  Optional[int] = self._current_player_
+    
     def _coordinate_to_state_(self,
         row:    int,
         column: int
@@ -272,23 +348,60 @@ class Board():
         """
         return row * self._size_ + column
     
-    def _evaluate_move_(self) -> float:
-        """# Evaluate (Last) Move.
+    def _finalize_move_(self) -> Tuple[float, bool]:
+        """# Finalize (Last) Move.
+        
+        Read winner and board occupancy once, deriving both the reward and the done flag from them.
 
         ## Returns:
-            * float:    Reward yielded/penalty incurred by last move.
+            * Tuple[float, bool]:
+                - float:    Reward yielded/penalty incurred by last move.
+                - bool:     Done flag indicating if the game has ended.
         """
-        # If game is not over, simply assign step penalty.
-        if not self.is_over:    return self._step_penalty_
+        # Read game state once.
+        winner: Optional[int] = self._winner_
+        
+        # Player won, so assign reward.
+        if winner ==  1:        return self._win_reward_,   True
         
-        # If game is a draw, assign draw penalty.
-        if self.is_draw:        return self._draw_penalty_
+        # Opponent won, so assign loss penalty.
+        if winner == -1:        return self._loss_penalty_, True
         
-        # If opponent won, assign loss penalty.
-        if self.winner == -1:   return self._loss_penalty_
+        # If board is full with no winner, game is a draw, so assign draw penalty.
+        if self.is_full:        return self._draw_penalty_, True
         
-        # Otherwise, player won, so assign reward.
-        if self.winner == 1:    return self._win_reward_
+        # Otherwise, game is not over, so simply assign step penalty.
+        return self._step_penalty_, False
+    
+    def _has_won_(self,
+        bitboard:   int,
+        index:      int
+    ) -> bool:
+        """# Has Won?
+        
+        For the standard 3x3 board, lines are detected with shift-AND sequences over the whole 
+        bitboard (start bits are masked to prevent lines from wrapping across rows). Other sizes 
+        test the masks of the lines passing through the cell last marked.
+
+        ## Args:
+            * bitboard  (int):  Bitboard of player being evaluated.
+            * index     (int):  Index of cell last marked by player.
+
+        ## Returns:
+            * bool: True if bitboard contains a complete line.
+        """
+        # Standard board.
+        if self._size_ == 3:
+            
+            return  bool(
+                        (bitboard & (bitboard >> 1) & (bitboard >> 2) & 0b001001001)    or  # Rows.
+                        (bitboard & (bitboard >> 3) & (bitboard >> 6))                  or  # Columns.
+                        (bitboard & (bitboard >> 4) & (bitboard >> 8))                  or  # Diagonal.
+                        (bitboard & (bitboard >> 2) & (bitboard >> 4) & 0b000000100)        # Anti-diagonal.
+                    )
+        
+        # Otherwise, test each line through cell.
+        return any(bitboard & mask == mask for mask in self._cell_masks_[index])
     
     def _is_in_bounds_(self,
         row:    int,
@@ -305,6 +418,20 @@ class Board():
         """
         return 0 <= row < self._size_ and 0 <= column < self._size_
     
+    def _legal_actions_(self) -> NDArray:
+        """# Legal Actions.
+        
+        Locate the empty cells of the board, reusing the result until the next move is made.
+
+        ## Returns:
+            * NDArray:  Indices of empty cells.
+        """
+        # Locate empty cells if board has changed since last lookup.
+        if self._legal_ is None:    self._legal_:   NDArray =   valid_actions(board = self._grid_)
+        
+        # Provide legal actions.
+        return self._legal_
+    
     def _move_is_valid_(self,
         row:    int,
         column: int
@@ -322,19 +449,33 @@ class Board():
         if not self._is_in_bounds_(row = row, column = column): return False
         
         # Otherwise, simply indicate that cell is empty.
-        return self._grid_[row][column].is_empty
+        return self._grid_[self._coordinate_to_state_(row = row, column = column)] == 0
     
     def _populate_grid_(self) -> None:
         """# Populate Grid.
         
         Initialize the board with empty cells, according to dimension specifications.
         """
-        self._grid_:    List[List[Cell]] =  [
-                                                [
-                                                    Cell(row = r, column = c)
-                                                    for c in range(self._size_)
-                                                ]   for r in range(self._size_)
-                                            ]
+        self._grid_:        NDArray =           zeros(self._size_ ** 2, dtype = int8)
+        
+        # Initialize one-hot encoding with every cell in empty channel.
+        self._onehot_:      NDArray =           zeros((self._size_, self._size_, 3), dtype = uint8)
+        self._onehot_[:, :, 0] =                1
+        
+        # Initialize player (index 0) & opponent (index 1) bitboards.
+        self._bitboards_:   List[int] =         [0, 0]
+        
+        # Every cell starts empty.
+        self._empty_count_: int =               self._size_ ** 2
+        
+        # Legal actions are located on demand.
+        self._legal_:       Optional[NDArray] = None
+        
+        # Empty position hashes to zero.
+        self._hash_:        int =               0
+        
+        # No winner yet.
+        self._winner_:      Optional[int] =     None
         
     def _state_to_coordinate_(self,
         state:  int
@@ -372,18 +513,25 @@ class Board():
 
         String representation of board.
         """
-        # Predefine separation line and column index.
-        line:           str =   ("\n   " + ("───┼" * (self._size_ - 1)) + ("─" * 3))
-        grid_string:    str =   ("   ") + " ".join(f" {column} " for column in range(self._size_))
+        # Flatten cell values to plain integers.
+        cells:  List[int] = self._grid_.tolist()
+        
+        # Start with column index.
+        parts:  List[str] = [self._header_]
         
         # For each row in grid...
-        for r, row in enumerate(self._grid_):
+        for r in range(self._size_):
             
-            # Render cell row.
-            grid_string += f"\n {r} " + "│".join(f" {cell} " for cell in row)
+            # Separate from previous row.
+            if r:   parts.append(self._separator_)
             
-            # Append line if not on last row.
-            grid_string += line if r < self._size_ - 1 else ""
+            # Render cell row.
+            parts.append(
+                f" {r} " + "│".join(
+                    f" {Player.from_number(number = cell)} "
+                    for cell in cells[r * self._size_:(r + 1) * self._size_]
+                )
+            )
             
         # Return string representation.
-        return grid_string
\ No newline at end of file
+        return "\n".join(parts)
\ No newline at end of file
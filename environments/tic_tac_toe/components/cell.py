@@ -5,12 +5,13 @@ This module defines the individual cell structure in a Tic-Tac-Toe board.
 
 __all__ = ["Cell"]
 
-from typing                                         import Tuple, Union
-
-from torch                                          import Tensor
+from typing                                         import Tuple, TYPE_CHECKING, Union
 
 from environments.tic_tac_toe.components.players    import Player
 
+# Annotation only.
+if TYPE_CHECKING:   from torch                      import Tensor
+
 class Cell():
     """# (Tic-Tac-Toe) Cell
     
@@ -61,10 +62,10 @@ class Cell():
         
         Indicate if cell is empty or has an entry.
         """
-        return self._player_ == Player.EMPTY
+        return self._is_empty_
     
     @property
-    def onehot(self) -> Tensor:
+    def onehot(self) -> "Tensor":
         """(Player) One-Hot Encoding.
 
         One-hot encoding representation of cell's player entry.
@@ -113,7 +114,8 @@ class Cell():
 
         Reset cell to initial state.
         """
-        self._player_:  Player =    Player.EMPTY
+        self._player_:      Player =    Player.EMPTY
+        self._is_empty_:    bool =      True
                                     
     # HELPERS ======================================================================================
         
@@ -125,20 +127,20 @@ class Cell():
         ## Args:
             * player    (Player | int | str): Player being entered into cell.
         """
-        # Match player type.
-        match player:
-            
-            # Object.
-            case Player() as p: self._player_:  Player =    p
-            
-            # Number value.
-            case int() as n:    self._player_:  Player =    Player.from_number(number = n)
-            
-            # Symbol value.
-            case str() as s:    self._player_:  Player =    Player.from_symbol(symbol = s)
-            
-            # Invalid type.
-            case _: raise TypeError(f"Invalid player type provided: {type(player)}")
+        # Object.
+        if isinstance(player, Player):  self._player_:  Player =    player
+        
+        # Number value.
+        elif isinstance(player, int):   self._player_:  Player =    Player.from_number(number = player)
+        
+        # Symbol value.
+        elif isinstance(player, str):   self._player_:  Player =    Player.from_symbol(symbol = player)
+        
+        # Invalid type.
+        else: raise TypeError(f"Invalid player type provided: {type(player)}")
+        
+        # Cache emptiness, so that it is not recomputed through enum comparison.
+        self._is_empty_:    bool =      self._player_.number == 0
     
     # DUNDERS ======================================================================================
     
@@ -0,0 +1,99 @@
+"""# ludorum.environments.tic_tac_toe.components.kernels
+
+This module provides vectorized kernels that evaluate Tic-Tac-Toe boards stored as flat (row-major)
+int8 arrays, in which +1 marks the player, -1 marks the opponent, and 0 marks an empty cell.
+"""
+
+__all__ =   [
+                "apply_actions",
+                "line_indices",
+                "valid_actions"
+            ]
+
+from typing         import Tuple
+
+from numpy          import arange, array, count_nonzero, flatnonzero, intp, where
+from numpy.typing   import NDArray
+
+def apply_actions(
+    boards:     NDArray,
+    players:    NDArray,
+    actions:    NDArray,
+    lines:      NDArray
+) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+    """# Apply Actions.
+
+    Apply one action to each of a batch of independent boards, without mutating the boards 
+    provided. Illegal actions (targeting an occupied cell) leave their board unchanged.
+
+    ## Args:
+        * boards    (NDArray):  Flat int8 boards, shaped (batch, size * size).
+        * players   (NDArray):  Player (+1 or -1) making the move on each board, shaped (batch,).
+        * actions   (NDArray):  Cell index played on each board, shaped (batch,).
+        * lines     (NDArray):  Cell indices of each winning line, shaped (lines, size).
+
+    ## Returns:
+        * Tuple[NDArray, NDArray, NDArray, NDArray]:
+            - NDArray:  Boards after actions have been applied.
+            - NDArray:  Winner of each board (+1, -1, or 0 if none).
+            - NDArray:  Done flag of each board.
+            - NDArray:  Legality of each action.
+    """
+    # Copy boards so that originals are left untouched.
+    boards:     NDArray =   boards.copy()
+    batch:      NDArray =   arange(boards.shape[0])
+
+    # Only actions targeting an empty cell are legal.
+    legal:      NDArray =   boards[batch, actions] == 0
+
+    # Mark cells of legal actions.
+    boards[batch[legal], actions[legal]] =  players[legal]
+
+    # Sum the entries of each line on every board.
+    sums:       NDArray =   boards[:, lines].sum(axis = 2)
+
+    # Resolve winner of each board.
+    winners:    NDArray =   where(
+                                (sums ==  lines.shape[1]).any(axis = 1),  1,
+                                where((sums == -lines.shape[1]).any(axis = 1), -1, 0)
+                            )
+
+    # Boards are done once won or full.
+    dones:      NDArray =   (winners != 0) | (count_nonzero(boards, axis = 1) == boards.shape[1])
+
+    # Return results.
+    return boards, winners, dones, legal
+
+def line_indices(
+    size:   int
+) -> NDArray:
+    """# Line Indices.
+
+    Enumerate the rows, columns, and diagonals of a board as flat (row-major) cell indices.
+
+    ## Args:
+        * size  (int):  Dimension of board.
+
+    ## Returns:
+        * NDArray:  Cell indices of each winning line, shaped (2 * size + 2, size).
+    """
+    return  array(
+                [[r * size + c for c in range(size)] for r in range(size)]  +
+                [[r * size + c for r in range(size)] for c in range(size)]  +
+                [[i * size + i for i in range(size)]]                       +
+                [[i * size + size - i - 1 for i in range(size)]],
+                dtype = intp
+            )
+
+def valid_actions(
+    board:  NDArray
+) -> NDArray:
+    """# Valid Actions.
+
+    ## Args:
+        * board (NDArray):  Flat int8 board.
+
+    ## Returns:
+        * NDArray:  Indices of empty cells on board.
+    """
+    return flatnonzero(board == 0)
@@ -6,44 +6,60 @@ This module provides the players for the Tic Tac Toe environment.
 __all__ = ["Player"]
 
 from enum           import Enum
+from functools      import cached_property
+from typing         import Dict, List, Sequence, Tuple, TYPE_CHECKING, Union
 
-from torch          import equal, tensor, Tensor
+from numpy.typing   import NDArray
+
+# Torch is only needed for annotations at import time.
+if TYPE_CHECKING:   from torch  import Tensor
 
 class Player(Enum):
     """(Tic-Tac-Toe) Glyph
 
     This enumeration defines the players used to represent the Tic Tac Toe environment.
-    """
     
-    EMPTY = {"number":  0, "symbol": " ", "onehot": tensor((1, 0, 0))}
-    X     = {"number":  1, "symbol": "X", "onehot": tensor((0, 1, 0))}
-    O     = {"number": -1, "symbol": "O", "onehot": tensor((0, 0, 1))}
+    ## Attributes:
+        * number    (int):              Integer value of the player: +1 (X), -1 (O), or 0 (empty).
+        * symbol    (str):              Symbolic representation of the player (e.g., 'X', 'O').
+        * encoding  (Tuple[int, ...]):  One-hot encoding of player, as plain integers.
+    """
     
-    # PROPERTIES ===================================================================================
+    EMPTY = ( 0, " ", (1, 0, 0))
+    X     = ( 1, "X", (0, 1, 0))
+    O     = (-1, "O", (0, 0, 1))
     
-    @property
-    def number(self) -> int:
-        """# (Player) Number
+    def __init__(self,
+        number:     int,
+        symbol:     str,
+        encoding:   Tuple[int, ...]
+    ):
+        """# Initialize Player.
+        
+        Attributes are bound directly to each member, rather than read from its value on every 
+        access.
 
-        Integer value of the player: +1 (X), -1 (O), or 0 (empty).
+        ## Args:
+            * number    (int):              Integer value of the player.
+            * symbol    (str):              Symbolic representation of the player.
+            * encoding  (Tuple[int, ...]):  One-hot encoding of player, as plain integers.
         """
-        return self.value["number"]
+        self.number:    int =               number
+        self.symbol:    str =               symbol
+        self.encoding:  Tuple[int, ...] =   encoding
     
-    @property
-    def onehot(self) -> Tensor:
-        """# (Player) One-Hot Encoding.
-
-        One-hot encoding representation of player.
-        """
-        return self.value["onehot"]
+    # PROPERTIES ===================================================================================
     
-    @property
-    def symbol(self) -> str:
-        """# (Player) Symbol
+    @cached_property
+    def onehot(self) -> "Tensor":
+        """# (Player) One-Hot Encoding.
 
-        Symbolic representation of the player (e.g., 'X', 'O').
+        One-hot encoding representation of player, materialized as a tensor on first access (so 
+        that importing players does not initialize torch).
         """
-        return self.value["symbol"]
+        from torch  import as_tensor
+        
+        return as_tensor(self.encoding)
     
     # CLASS METHODS ================================================================================
     
@@ -64,23 +80,21 @@ class Player(Enum):
         ## Returns:
             * Player:   Player initialized from value.
         """
-        # For each defined player...
-        for player in cls:
-            
-            # If it matches the value provided, return that player.
-            if player.number == number: return player
+        # Look up player by number.
+        try:                return _NUMBERS_[number]
             
         # Otherwise, report invalid player number.
-        raise ValueError(f"No player found with number {number}")
+        except KeyError:    raise ValueError(f"No player found with number {number}") from None
     
     @classmethod
     def from_onehot(cls,
-        encoding: Tensor
+        encoding: Union["Tensor", NDArray, Sequence[int]]
     ) -> "Player":
         """# (Player) from One-Hot Encoding.
 
         ## Args:
-            * onehot    (Tensor):  One-hot encoding representation of player.
+            * onehot    (Tensor | NDArray | Sequence[int]): One-hot encoding representation of 
+                                                            player.
 
         ## Raises:
             * ValueError:   If player encoding is not known.
@@ -88,14 +102,17 @@ class Player(Enum):
         ## Returns:
             * Player:   Player initialized from one-hot encoding.
         """
-        # For each defined player...
-        for player in cls:
-            
-            # If it matches the value provided, return that player.
-            if equal(player.onehot, encoding): return player
+        # Reduce encoding to plain integers.
+        values: List[int] = list(encoding) if isinstance(encoding, (list, tuple)) else encoding.tolist()
+        
+        # Encoding must set exactly one of the three channels.
+        if len(values) != 3 or sorted(values) != [0, 0, 1]:
             
-        # Otherwise, report invalid player number.
-        raise ValueError(f"No player found with encoding {encoding}")
+            # Report invalid encoding.
+            raise ValueError(f"No player found with encoding {encoding}")
+        
+        # Set channel identifies player.
+        return _CHANNELS_[values.index(1)]
     
     @classmethod
     def from_symbol(cls,
@@ -114,14 +131,11 @@ class Player(Enum):
         ## Returns:
             * Player:   Player initialized from symbol.
         """
-        # For each defined player...
-        for player in cls:
-            
-            # If it matches the value provided, return that player.
-            if player.symbol == symbol.upper(): return player
+        # Look up player by symbol.
+        try:                return _SYMBOLS_[symbol.upper()]
             
-        # OTherwise, report invalid player number.
-        raise ValueError(f"No player found with symbol {symbol}")
+        # Otherwise, report invalid player symbol.
+        except KeyError:    raise ValueError(f"No player found with symbol {symbol}") from None
     
     # DUNDERS ======================================================================================
     
@@ -137,4 +151,11 @@ class Player(Enum):
         
         Return the string representation of the glyph.
         """
-        return self.symbol
\ No newline at end of file
+        return self.symbol
+
+
+# LOOKUP TABLES ====================================================================================
+
+_CHANNELS_: Tuple[Player, ...] =   tuple(sorted(Player, key = lambda player: player.encoding.index(1)))
+_NUMBERS_:  Dict[int, Player] =     {player.number: player for player in Player}
+_SYMBOLS_:  Dict[str, Player] =     {player.symbol: player for player in Player}
\ No newline at end of file
@@ -4,12 +4,19 @@ Ludorum application driver.
 """
 
 from argparse   import Namespace
+from importlib  import import_module
 from logging    import Logger
+from typing     import Dict
 
 from __args__   import parse_ludorum_arguments
-from agents     import *
 from utilities  import BANNER, get_logger
 
+# Mapping of commands to the modules defining their entry points. A command's module is only imported 
+# once arguments have been parsed, so that help & usage errors exit before any command is loaded.
+_COMMANDS_:         Dict[str, str] =    {
+                                            "q-learning":   "agents.q_learning",
+                                        }
+
 if __name__ == "__main__":
     """Execute command."""
     
@@ -23,16 +30,11 @@ if __name__ == "__main__":
                                                 logging_path =  _arguments_.logging_path
                                             )
     
-    # Define mapping of commands to their respective entry points.
-    _commands_:     dict[str, callable] =   {
-                                                "q-learning":   q_learning.main,
-                                            }
-    
     try:# Log banner
         _logger_.info(BANNER)
         
         # Execute command provided.
-        _commands_[_arguments_.command](**vars(_arguments_))
+        import_module(_COMMANDS_[_arguments_.command]).main(**vars(_arguments_))
     
     # Catch wildcard errors
     except Exception as e:  _logger_.critical(
@@ -1,19 +1,40 @@
 """# ludorum.spaces.base
 
-Defines the abstract class representation for action and observation spaces.
+Defines the protocol to which action and observation spaces adhere.
 """
 
 __all__ = ["Space"]
 
-from abc    import ABC, abstractmethod
-from typing import Any
+from abc        import abstractmethod
+from functools  import cache
+from typing     import Any, Protocol, runtime_checkable, TYPE_CHECKING
 
-class Space(ABC):
-    """# Abstract Space
+if TYPE_CHECKING:   from numpy.random   import Generator
 
-    Defines the abstract interface for an action or observation space.
+@cache
+def _rng_() -> "Generator":
+    """# (Shared) Random Number Generator.
+
+    Constructed on first draw, so that importing spaces does not load numpy's random subsystem.
+
+    ## Returns:
+        * Generator:    Random number generator shared by all spaces.
+    """
+    from numpy.random   import default_rng
+    
+    return default_rng()
+
+@runtime_checkable
+class Space(Protocol):
+    """# Space (Protocol)
+
+    Defines the interface for an action or observation space. Spaces declare `__slots__`, so that 
+    instances carry no `__dict__`.
     """
     
+    # Space defines no attributes of its own.
+    __slots__ = ()
+    
     # METHODS ======================================================================================
     
     @abstractmethod
@@ -39,7 +60,6 @@ class Space(ABC):
     
     # DUNDERS ======================================================================================
     
-    @abstractmethod
     def __repr__(self) -> str:
         """# Object Representation.
 
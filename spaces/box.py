@@ -5,12 +5,12 @@ Defines a multi-dimensional array space representation.
 
 __all__ = ["Box"]
 
-from typing             import Tuple, Union
+from typing             import Callable, Tuple, Union
 
-from numpy              import all, array, ndarray
-from numpy.random       import uniform
+from numpy              import array, asarray, broadcast_to, dtype as DType, float32, float64, integer, issubdtype, ndarray, ndim
+from numpy.typing       import ArrayLike
 
-from spaces.__base__    import Space
+from spaces.__base__    import _rng_, Space
 
 class Box(Space):
     """# Box (Space)
@@ -18,35 +18,59 @@ class Box(Space):
     Multi-dimensional array space.
     """
     
+    # Attributes.
+    __slots__ = ("_draw_", "_dtype_", "_lower_", "_lower_array_", "_repr_", "_scalar_bounds_", "_shape_", "_span_array_", "_upper_", "_upper_array_")
+    
     def __init__(self,
-        lower:  Union[int, float],
-        upper:  Union[int, float],
+        lower:  Union[int, float, ArrayLike],
+        upper:  Union[int, float, ArrayLike],
         shape:  Tuple[Union[int, float], ...],
         dtype:  Union[type, str] =              float
     ):
         """# Instantiate Box (Space).
 
         ## Args:
-            * lower (Union[int, float]):                Lower bound.
-            * upper (Union[int, float]):                Upper bound.
+            * lower (Union[int, float, ArrayLike]):     Lower bound, either shared by all elements 
+                                                        or given per element (broadcastable to 
+                                                        shape).
+            * upper (Union[int, float, ArrayLike]):     Upper bound, either shared by all elements 
+                                                        or given per element (broadcastable to 
+                                                        shape).
             * shape (Tuple[Union[int, float], ...]):    Shape of space.
             * dtype (Union[type, str], optional):       Data type (e.g., int, float). Defaults to 
                                                         float.
         """
         # Define bounds.
-        self._lower_:   Union[int, float] =             lower
-        self._upper_:   Union[int, float] =             upper
+        self._lower_:           Union[int, float, ArrayLike] =  lower
+        self._upper_:           Union[int, float, ArrayLike] =  upper
         
         # Define shape.
-        self._shape_:   Tuple[Union[int, float], ...] = shape
+        self._shape_:           Tuple[Union[int, float], ...] = tuple(shape)
+        
+        # Define data type (resolved once, so that sampling never re-resolves it).
+        self._dtype_:           DType =                         DType(dtype)
+        
+        # Materialize bounds once as contiguous arrays of the box's shape & type, so that sampling & 
+        # verification never re-broadcast them.
+        self._scalar_bounds_:   bool =                          ndim(lower) == 0 and ndim(upper) == 0
+        self._lower_array_:     ndarray =                       broadcast_to(asarray(lower, dtype = self._dtype_), self._shape_).copy()
+        self._upper_array_:     ndarray =                       broadcast_to(asarray(upper, dtype = self._dtype_), self._shape_).copy()
+        self._span_array_:      ndarray =                       self._upper_array_.astype(float64) - self._lower_array_
+        
+        # Select drawing routine for data type once, rather than branching on every sample.
+        self._draw_:            Callable[..., ndarray] =        (
+                                                                    self._draw_floats_   if self._dtype_ in (float32, float64)   else
+                                                                    self._draw_integers_ if issubdtype(self._dtype_, integer)    else
+                                                                    self._draw_uniform_
+                                                                )
+        
+        # Render representation once, since space is immutable.
+        self._repr_:            str =                           f"<Box(lower = {self._lower_}, upper = {self._upper_}, shape = {self._shape_})>"
         
-        # Define data type.
-        self._dtype_:   Union[type, str] =              dtype
-    
     # PROPERTIES ===================================================================================
     
     @property
-    def dtype(self) -> Union[type, str]:
+    def dtype(self) -> DType:
         """# (Box Space) Data Type
 
         The data type of all elements within space.
@@ -54,7 +78,7 @@ class Box(Space):
         return self._dtype_
     
     @property
-    def lower_bound(self) -> Union[int, float]:
+    def lower_bound(self) -> Union[int, float, ArrayLike]:
         """# (Box Space) Lower Bound
 
         Lower bound of all dimensions of space.
@@ -70,7 +94,7 @@ class Box(Space):
         return self._shape_
     
     @property
-    def upper_bound(self) -> Union[int, float]:
+    def upper_bound(self) -> Union[int, float, ArrayLike]:
         """(# Box Space) Upper Bound
 
         Upper bound of all dimensions of space.
@@ -93,12 +117,15 @@ class Box(Space):
         # Convert x to an ndarray if it is another type.
         if not isinstance(x, ndarray): x: ndarray = array(x)
         
-        # Evaluate existence.
-        return  (
-                    x.shape == self._shape_ and
-                    all(x >= self._lower_)  and
-                    all(x <= self._upper_)
-                )
+        # Shape must match before elements are inspected.
+        if x.shape != self._shape_: return False
+        
+        # Bounds shared by all elements only need to be compared against extremes (two reductions, 
+        # no intermediate boolean arrays).
+        if self._scalar_bounds_:    return x.size == 0 or bool(x.min() >= self._lower_ and x.max() <= self._upper_)
+        
+        # Otherwise, compare element-wise against precomputed bound arrays.
+        return bool((x >= self._lower_array_).all() and (x <= self._upper_array_).all())
         
     def sample(self) -> ndarray:
         """# Sample (Box Space).
@@ -106,11 +133,123 @@ class Box(Space):
         ## Returns:
             * ndarray:  Random sample from box space.
         """
-        return  uniform(
-                    low =   self._lower_,
-                    high =  self._upper_,
-                    size =  self._shape_
-                ).astype(self._dtype_)
+        return self._draw_(size = self._shape_)
+    
+    def sample_n(self,
+        k:  int
+    ) -> ndarray:
+        """# Sample N (Box Space).
+        
+        Draw several samples in a single call to the random number generator.
+
+        ## Args:
+            * k (int):  Number of samples being drawn.
+
+        ## Returns:
+            * ndarray:  Random samples from box space, shaped (k, *shape).
+        """
+        return self._draw_(size = (k,) + self._shape_)
+    
+    def sample_into(self,
+        out:    ndarray
+    ) -> ndarray:
+        """# Sample Into (Buffer).
+        
+        Write a sample into a caller-provided buffer, so that repeated sampling can reuse one array 
+        rather than allocating a new one per call.
+
+        ## Args:
+            * out   (ndarray):  Buffer of box's shape & data type, which is overwritten.
+
+        ## Returns:
+            * ndarray:  Buffer provided, holding random sample from box space.
+        """
+        # Assert that buffer matches space.
+        assert out.shape == self._shape_ and out.dtype == self._dtype_, \
+            f"Buffer of shape {self._shape_} and type {self._dtype_} expected, got {out.shape} and {out.dtype}"
+        
+        # Floating point samples can be drawn, scaled, & shifted entirely in place.
+        if self._dtype_ in (float32, float64):
+            
+            # Draw unit samples into buffer.
+            _rng_().random(dtype = self._dtype_, out = out)
+            
+            # Scale & shift into bounds.
+            out *=  self._span_array_
+            out +=  self._lower_array_
+            
+        # Otherwise, copy draw into buffer (generator offers no in-place draw for other types).
+        else:   out[...] =  self._draw_(size = self._shape_)
+        
+        # Provide buffer.
+        return out
+    
+    # HELPERS ======================================================================================
+    
+    def _draw_floats_(self,
+        size:   Tuple[int, ...]
+    ) -> ndarray:
+        """# Draw Floats.
+        
+        Floating point samples are drawn directly in target precision, then scaled in place.
+
+        ## Args:
+            * size  (Tuple[int, ...]):  Shape of draw, whose trailing dimensions match box's shape.
+
+        ## Returns:
+            * ndarray:  Random values within bounds.
+        """
+        # Draw unit samples.
+        sample: ndarray =   _rng_().random(size = size, dtype = self._dtype_)
+        
+        # Scale & shift into bounds.
+        sample *=           self._span_array_
+        sample +=           self._lower_array_
+        
+        # Provide sample.
+        return sample
+    
+    def _draw_integers_(self,
+        size:   Tuple[int, ...]
+    ) -> ndarray:
+        """# Draw Integers.
+        
+        Integer samples are drawn directly in box's data type over the closed range [lower, upper], 
+        matching the inclusive bounds against which membership is verified.
+
+        ## Args:
+            * size  (Tuple[int, ...]):  Shape of draw, whose trailing dimensions match box's shape.
+
+        ## Returns:
+            * ndarray:  Random values within bounds.
+        """
+        return  _rng_().integers(
+                    low =       self._lower_array_,
+                    high =      self._upper_array_,
+                    size =      size,
+                    dtype =     self._dtype_,
+                    endpoint =  True
+                )
+    
+    def _draw_uniform_(self,
+        size:   Tuple[int, ...]
+    ) -> ndarray:
+        """# Draw Uniform.
+        
+        Draw double precision samples & cast them to box's data type (without copying if already of 
+        type).
+
+        ## Args:
+            * size  (Tuple[int, ...]):  Shape of draw, whose trailing dimensions match box's shape.
+
+        ## Returns:
+            * ndarray:  Random values within bounds.
+        """
+        return  _rng_().uniform(
+                    low =   self._lower_array_,
+                    high =  self._upper_array_,
+                    size =  size
+                ).astype(self._dtype_, copy = False)
     
     # DUNDERS ======================================================================================
     
@@ -119,4 +258,4 @@ class Box(Space):
 
         Object representation of box space.
         """
-        return f"<Box(lower = {self._lower_}, upper = {self._upper_}, shape = {self._shape_})>"
\ No newline at end of file
+        return self._repr_
\ No newline at end of file
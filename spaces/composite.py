@@ -15,6 +15,9 @@ class Composite(Space):
     Dictionary-style combination of named subspaces.
     """
     
+    # Attributes.
+    __slots__ = ("_repr_", "_subspaces_")
+    
     def __init__(self,
         subspaces: Dict[str, Space]
     ):
@@ -26,6 +29,9 @@ class Composite(Space):
         # Define subspaces.
         self._subspaces_:   Dict[str, Space] =  subspaces
         
+        # Render representation once, since space is immutable.
+        self._repr_:        str =               f"""<Composite(subspaces = {", ".join(f"{k}: {v}" for k, v in self.subspaces.items())})>"""
+        
     # PROPERTIES ===================================================================================
     
     @property
@@ -50,16 +56,14 @@ class Composite(Space):
         ## Returns:
             * bool: True if all values of mapping exist within subspaces.
         """
-        return  all([
-                    isinstance(m, dict),
-                    all(
-                        [
-                            key in self.subspaces,
-                            self.subspaces[key.contains[m[key]]]
-                        ]
-                        for key in self.subspaces.items()
-                    ) 
-                ])
+        # Value must be a mapping.
+        if not isinstance(m, dict):                     return False
+        
+        # Keys must match subspaces exactly (compared as sets, without visiting values).
+        if m.keys() != self._subspaces_.keys():         return False
+        
+        # Every value must belong to its subspace.
+        return all(space.contains(m[key]) for key, space in self._subspaces_.items())
         
     def sample(self) -> Dict[str, Any]:
         """# Sample (Composite Space).
@@ -67,7 +71,7 @@ class Composite(Space):
         ## Returns:
             * Dict[str, Any]:   Random value samples from each subspace.
         """
-        return {key: space.sample() for key, space in self.subspaces.items()}
+        return {key: space.sample() for key, space in self._subspaces_.items()}
     
     # DUNDERS ======================================================================================
     
@@ -76,4 +80,4 @@ class Composite(Space):
 
         Object representation of composite space.
         """
-        return f"""<Composite(subspaces = {", ".join(f"{k}: {v}" for k, v in self.subspaces.items())})>"""
\ No newline at end of file
+        return self._repr_
\ No newline at end of file
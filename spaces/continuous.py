@@ -17,6 +17,9 @@ class Continuous(Space):
     Scalar-valued continuous space.
     """
     
+    # Attributes.
+    __slots__ = ("_lower_", "_repr_", "_upper_")
+    
     def __init__(self,
         lower:  Union[float, int] = -inf,
         upper:  Union[float, int] =  inf
@@ -34,6 +37,9 @@ class Continuous(Space):
         # Validate parameters.
         self.__post_init__()
         
+        # Render representation once, since space is immutable.
+        self._repr_:    str =   f"<Continuous(lower = {self.lower}, upper = {self.upper})>"
+        
     def __post_init__(self) -> None:
         """# Validate Parameters.
         
@@ -51,7 +57,7 @@ class Continuous(Space):
 
         Lower and upper bounds of space.
         """
-        return self.lower, self.upper
+        return self._lower_, self._upper_
     
     @property
     def lower(self) -> float:
@@ -82,7 +88,10 @@ class Continuous(Space):
         ## Returns:
             * bool: True if x ∈ S.
         """
-        return isinstance(x, (float, int)) and self.lower <= x < self.upper
+        # Exact-type checks settle plain floats & ints without walking the MRO, while isinstance 
+        # still admits subclasses (e.g., numpy.float64).
+        return  (type(x) is float or type(x) is int or isinstance(x, (float, int))) and \
+                self._lower_ <= x < self._upper_
     
     def sample(self) -> float:
         """# Sample (Continuous Space).
@@ -92,7 +101,7 @@ class Continuous(Space):
         ## Returns:
             * float:    Random scalar value from space.
         """
-        return uniform(self.lower, self.upper)
+        return uniform(self._lower_, self._upper_)
     
     # DUNDERS ======================================================================================
     
@@ -101,4 +110,4 @@ class Continuous(Space):
 
         Object representation of continuous space.
         """
-        return f"<Continuous(lower = {self.lower}, upper = {self.upper})>"
\ No newline at end of file
+        return self._repr_
\ No newline at end of file
@@ -5,9 +5,16 @@ Defines a discrete (integer-indexed) space.
 
 __all__ = ["Discrete"]
 
-from random             import randint
+from random             import Random
+from typing             import Callable
 
-from spaces.__base__    import Space
+from numpy              import int64, ndarray
+
+from spaces.__base__    import _rng_, Space
+
+# Bound uniform draw over [0, n) shared by all discrete spaces. Calling it directly skips the argument 
+# validation & inclusive-range arithmetic that `randint` performs on every call.
+_RANDBELOW_:    Callable[[int], int] =  Random()._randbelow
 
 class Discrete(Space):
     """# Discrete (Space)
@@ -15,6 +22,9 @@ class Discrete(Space):
     Scalar-valued discrete space.
     """
     
+    # Attributes.
+    __slots__ = ("_n_", "_repr_")
+    
     def __init__(self,
         n:  int
     ):
@@ -29,6 +39,9 @@ class Discrete(Space):
         # Validate parameters.
         self.__post_init__()
         
+        # Render representation once, since space is immutable.
+        self._repr_:    str =   f"<Discrete(n = {self.n})>"
+        
     def __post_init__(self) -> None:
         """# Validate parameters.
         
@@ -60,7 +73,7 @@ class Discrete(Space):
         ## Returns:
             * bool: True if x ∈ S.
         """
-        return isinstance(x, int) and 0 <= x < self.n
+        return isinstance(x, int) and 0 <= x < self._n_
     
     def sample(self) -> int:
         """# Sample (Discrete Space).
@@ -68,7 +81,23 @@ class Discrete(Space):
         ## Returns:
             * int:  Random element from space.
         """
-        return randint(0, self.n - 1)
+        return _RANDBELOW_(self._n_)
+    
+    def sample_n(self,
+        k:  int
+    ) -> ndarray:
+        """# Sample N (Discrete Space).
+        
+        Draw several elements in a single call to the random number generator (e.g., one action per 
+        environment in a vectorized rollout).
+
+        ## Args:
+            * k (int):  Number of elements being drawn.
+
+        ## Returns:
+            * ndarray:  Random elements from space, shaped (k,).
+        """
+        return _rng_().integers(0, self._n_, size = k, dtype = int64)
     
     # DUNDERS ======================================================================================
     
@@ -77,4 +106,4 @@ class Discrete(Space):
 
         Object representation of discrete space.
         """
-        return f"<Discrete(n = {self.n})>"
\ No newline at end of file
+        return self._repr_
\ No newline at end of file
@@ -5,10 +5,11 @@ Defines a multi-dimensional continuous space.
 
 __all__ = ["MultiContinuous"]
 
-from random             import uniform
 from typing             import Tuple, Union
 
-from spaces.__base__    import Space
+from numpy              import asarray, flatnonzero, float64, ndarray
+
+from spaces.__base__    import _rng_, Space
 
 class MultiContinuous(Space):
     """# Multi-Continuous (Space)
@@ -16,12 +17,34 @@ class MultiContinuous(Space):
     Vector-valued continuous space.
     """
     
+    # Attributes.
+    __slots__ = ("_bounds_", "_highs_", "_lows_", "_repr_", "_spans_")
+    
     def __init__(self,
         bounds: Tuple[Tuple[Union[float, int], Union[float, int]]]
     ):
+        """# Instantiate Multi-Continuous (Space).
+
+        ## Args:
+            * bounds    (Tuple[Tuple[Union[float, int], Union[float, int]]]):   Lower & upper bound 
+                                                                                of each dimension.
+        """
         # Define bounds.
         self._bounds_:  Tuple[Tuple[Union[float, int], Union[float, int]]] =    bounds
         
+        # Split bounds into arrays once, so that all dimensions are validated, verified, & sampled 
+        # in a single call.
+        pairs:          ndarray =                                               asarray(bounds, dtype = float64).reshape(-1, 2)
+        self._lows_:    ndarray =                                               pairs[:, 0].copy()
+        self._highs_:   ndarray =                                               pairs[:, 1].copy()
+        self._spans_:   ndarray =                                               self._highs_ - self._lows_
+        
+        # Validate parameters.
+        self.__post_init__()
+        
+        # Render representation once, since space is immutable.
+        self._repr_:    str =   f"<MultiContinuous(bounds = {self.bounds})>"
+        
     def __post_init__(self) -> None:
         """# Validate Parameters.
         
@@ -29,12 +52,12 @@ class MultiContinuous(Space):
             * AssertionError:   If any dimension's upper bound is less than its corresponding lower 
                                 bound.
         """
-        # For each dimension...
-        for d, dimension in enumerate(self.bounds, start = 1):
-            
-            # Assert that upper bound is greater than lower bound.
-            assert dimension[0] < dimension[1], \
-                f"Dimension {d}: Upper bound {dimension[1]} must be greater than lower bound {dimension[0]}"
+        # Identify (1-indexed) dimensions whose upper bound does not exceed their lower bound.
+        invalid:    ndarray =   flatnonzero(self._lows_ >= self._highs_) + 1
+        
+        # Assert that every upper bound is greater than its lower bound.
+        assert invalid.size == 0, \
+            f"Dimension(s) {invalid.tolist()}: Upper bound must be greater than lower bound, got {self.bounds}"
         
     # PROPERTIES ===================================================================================
     
@@ -60,15 +83,14 @@ class MultiContinuous(Space):
         ## Returns:
             * bool: True if v ∈ S.
         """
-        return  all([
-                    isinstance(v, tuple),
-                    len(v) == len(self.bounds),
-                    all(
-                        bound[0] <= v_i < bound[1]
-                        for v_i, bound
-                        in zip(v, self.bounds)
-                    )
-                ])
+        # Value must be a vector of matching dimensionality.
+        if not isinstance(v, tuple) or len(v) != len(self._lows_):  return False
+        
+        # Convert vector once, then compare all dimensions against cached bounds at once.
+        v:  ndarray =   asarray(v)
+        
+        # Evaluate existence.
+        return bool(((v >= self._lows_) & (v < self._highs_)).all())
         
     def sample(self) -> Tuple[float, ...]:
         """# Sample (Multi-Continuous Space).
@@ -76,7 +98,35 @@ class MultiContinuous(Space):
         ## Returns:
             * Tuple[float, ...]:    Random vector value from space.
         """
-        return (uniform(bound[0], bound[1]) for bound in self.bounds)
+        return tuple(_rng_().uniform(self._lows_, self._highs_).tolist())
+    
+    def sample_into(self,
+        out:    ndarray
+    ) -> ndarray:
+        """# Sample Into (Buffer).
+        
+        Write a sample into a caller-provided float64 buffer in place, rather than materializing a 
+        new tuple per call.
+
+        ## Args:
+            * out   (ndarray):  Float64 buffer with one entry per dimension, which is overwritten.
+
+        ## Returns:
+            * ndarray:  Buffer provided, holding random vector value from space.
+        """
+        # Assert that buffer matches space.
+        assert out.shape == self._lows_.shape and out.dtype == float64, \
+            f"Float64 buffer of shape {self._lows_.shape} expected, got {out.dtype} buffer of shape {out.shape}"
+        
+        # Draw unit samples into buffer.
+        _rng_().random(out = out)
+        
+        # Scale & shift into bounds.
+        out *=  self._spans_
+        out +=  self._lows_
+        
+        # Provide buffer.
+        return out
     
     # DUNDERS ======================================================================================
     
@@ -85,4 +135,4 @@ class MultiContinuous(Space):
 
         Object representation of multi-continuous space.
         """
-        return f"<MultiContinuous(bounds = {self.bounds})>"
\ No newline at end of file
+        return self._repr_
\ No newline at end of file
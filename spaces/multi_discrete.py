@@ -5,10 +5,11 @@ Defines a multi-discrete space (vector of discrete values).
 
 __all__ = ["MultiDiscrete"]
 
-from random             import randint
 from typing             import Tuple
 
-from spaces.__base__    import Space
+from numpy              import array, asarray, int64, ndarray
+
+from spaces.__base__    import _rng_, Space
 
 class MultiDiscrete(Space):
     """# Multi-Discrete (Space)
@@ -16,6 +17,9 @@ class MultiDiscrete(Space):
     Vector-valued discrete space.
     """
     
+    # Attributes.
+    __slots__ = ("_dimensions_", "_repr_", "_shape_")
+    
     def __init__(self,
         shape:  Tuple[int, ...]
     ):
@@ -26,18 +30,25 @@ class MultiDiscrete(Space):
                                         elements.
         """
         # Define shape.
-        self._shape_:   Tuple[int, ...] =   shape
+        self._shape_:       Tuple[int, ...] =   shape
+        
+        # Record shape as an array as well, so that all dimensions are validated, verified, & sampled 
+        # in a single call.
+        self._dimensions_:  ndarray =           array(shape, dtype = int64)
         
         # Validate parameters.
         self.__post_init__()
         
+        # Render representation once, since space is immutable.
+        self._repr_:    str =   f"<MultiDiscrete(shape = {self.shape})>"
+        
     def __post_init__(self) -> None:
         """# Validate Parameters.
         
         ## Raises:
             * AssertionError:   If any dimension of shape is not a positive integer.
         """
-        return all(d > 0 for d in self.shape)
+        assert (self._dimensions_ > 0).all(), f"Multi-discrete space dimensions must be positive, got shape = {self.shape}"
     
     # PROPERTIES ===================================================================================
     
@@ -62,15 +73,14 @@ class MultiDiscrete(Space):
         ## Returns:
             * bool: True if v ∈ S.
         """
-        return  all([
-                    isinstance(v, tuple),
-                    len(v) == len(self.shape),
-                    all(
-                        0 <= v_i < dimension
-                        for v_i, dimension
-                        in zip(v, self.shape)
-                    )
-                ])
+        # Value must be a vector of matching dimensionality.
+        if not isinstance(v, tuple) or len(v) != len(self._dimensions_):    return False
+        
+        # Convert vector once, then compare all dimensions against cached shape at once.
+        v:  ndarray =   asarray(v)
+        
+        # Evaluate existence.
+        return bool(((v >= 0) & (v < self._dimensions_)).all())
         
     def sample(self) -> Tuple[int, ...]:
         """# Sample (Multi-Discrete Space).
@@ -78,7 +88,7 @@ class MultiDiscrete(Space):
         ## Returns:
             * Tuple[int, ...]:  Random vector value within space.
         """
-        return (randint(0, dimension - 1) for dimension in self.shape)
+        return tuple(_rng_().integers(0, self._dimensions_).tolist())
     
     # DUNDERS ======================================================================================
     
@@ -87,4 +97,4 @@ class MultiDiscrete(Space):
 
         Object representation of multi-discrete space.
         """
-        return f"<MultiDiscrete(shape = {self.shape})>"
\ No newline at end of file
+        return self._repr_
\ No newline at end of file
@@ -3,7 +3,43 @@
 Utilities package.
 """
 
-__all__ = ["BANNER", "get_child", "get_logger"]
+__all__ = ["BANNER", "colored", "DeferredSubParsersAction", "get_child", "get_logger", "LazyArgumentParser"]
+
+from importlib              import import_module
+from typing                 import Any, Dict
 
 from utilities.banner       import BANNER
-from utilities.logger       import get_child, get_logger
\ No newline at end of file
+from utilities.color        import colored
+
+# Exports whose modules pull in argparse or logging's handlers, mapped to their defining module. 
+# These are only imported on first access, so that lightweight consumers (e.g., square renderings 
+# using `colored`) do not pay for them.
+_LAZY_EXPORTS_: Dict[str, str] =    {
+                                        "DeferredSubParsersAction": "utilities.arguments",
+                                        "get_child":                "utilities.logger",
+                                        "get_logger":               "utilities.logger",
+                                        "LazyArgumentParser":       "utilities.arguments"
+                                    }
+
+def __getattr__(
+    name:   str
+) -> Any:
+    """# Get (Lazy) Attribute.
+
+    ## Args:
+        * name  (str):  Name of attribute being accessed.
+
+    ## Raises:
+        * AttributeError:   If package does not export attribute.
+
+    ## Returns:
+        * Any:  Attribute, imported from its defining module.
+    """
+    # Report attributes that are not exported.
+    if name not in _LAZY_EXPORTS_:  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import attribute & bind it to package, so that subsequent accesses bypass this hook.
+    globals()[name] = attribute =   getattr(import_module(_LAZY_EXPORTS_[name]), name)
+
+    # Provide attribute.
+    return attribute
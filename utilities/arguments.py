@@ -0,0 +1,128 @@
+"""# ludorum.utilities.arguments
+
+Argument parsing utilities.
+"""
+
+__all__ = ["DeferredSubParsersAction", "LazyArgumentParser"]
+
+from argparse               import ArgumentParser, Namespace, _SubParsersAction
+from importlib              import import_module
+from typing                 import Any, Dict, Optional, Sequence, Tuple
+
+class DeferredSubParsersAction(_SubParsersAction):
+    """# Deferred Sub-Parsers Action
+
+    Sub-parsers action whose parsers may be registered as placeholders (name & help only). A
+    placeholder is only replaced by its fully built parser (arguments & nested sub-parsers) once its
+    command is actually selected on the command line, so that unselected command trees are never
+    constructed.
+    """
+
+    def __init__(self,
+        *args:      Any,
+        **kwargs:   Any
+    ):
+        """# Instantiate Deferred Sub-Parsers Action."""
+        # Initialize sub-parsers action.
+        super().__init__(*args, **kwargs)
+
+        # Initialize deferred registrations, keyed by command.
+        self._deferred_:    Dict[str, Tuple[str, str]] =    {}
+
+    # METHODS ======================================================================================
+
+    def defer_parser(self,
+        name:       str,
+        help:       str,
+        module:     str,
+        registrar:  str
+    ) -> None:
+        """# Defer Parser (Registration).
+
+        ## Args:
+            * name      (str):  Command name.
+            * help      (str):  Command help, listed by parent's help message.
+            * module    (str):  Module from which registration function is imported.
+            * registrar (str):  Name of registration function, which is called with this action as
+                                its `parent_subparser` once command is selected.
+        """
+        # Register placeholder, so that command is listed & accepted as a choice.
+        self.add_parser(name = name, help = help)
+
+        # Record registration.
+        self._deferred_[name] = (module, registrar)
+
+    # HELPERS ======================================================================================
+
+    def _build_(self,
+        name:   str
+    ) -> None:
+        """# Build (Deferred Parser).
+
+        ## Args:
+            * name  (str):  Command whose parser is being built.
+        """
+        # Fetch deferred registration.
+        module, registrar =     self._deferred_.pop(name)
+
+        # Note placeholder's position among commands & their help entries.
+        parser_index:   int =   list(self._name_parser_map).index(name)
+        choice_index:   int =   [action.dest for action in self._choices_actions].index(name)
+
+        # Discard placeholder, which registration replaces.
+        del self._name_parser_map[name]
+        del self._choices_actions[choice_index]
+
+        # Register parser (appended after every other command).
+        getattr(import_module(module), registrar)(parent_subparser = self)
+
+        # Move parser back to placeholder's position, so that commands keep their listed order (the 
+        # map is updated in place, since it is shared as the action's choices).
+        parsers:        list =  list(self._name_parser_map.items())
+        parsers.insert(parser_index, parsers.pop())
+        self._name_parser_map.clear()
+        self._name_parser_map.update(parsers)
+
+        # Likewise for its help entry.
+        self._choices_actions.insert(choice_index, self._choices_actions.pop())
+
+    # DUNDERS ======================================================================================
+
+    def __call__(self,
+        parser:         ArgumentParser,
+        namespace:      Namespace,
+        values:         Sequence[str],
+        option_string:  Optional[str] = None
+    ) -> None:
+        """# Parse Command.
+
+        ## Args:
+            * parser        (ArgumentParser):   Parent parser.
+            * namespace     (Namespace):        Name space being populated.
+            * values        (Sequence[str]):    Selected command, followed by its arguments.
+            * option_string (str):              Option string, if any. Defaults to None.
+        """
+        # Build selected command's parser if it has only been deferred.
+        if values[0] in self._deferred_:    self._build_(name = values[0])
+
+        # Parse command's arguments.
+        super().__call__(parser, namespace, values, option_string)
+
+class LazyArgumentParser(ArgumentParser):
+    """# Lazy Argument Parser
+
+    Argument parser whose sub-parsers default to deferred construction. Since sub-parsers are
+    instantiated with their parent's class, every parser in a tree rooted at a lazy parser is lazy
+    as well.
+    """
+
+    def __init__(self,
+        *args:      Any,
+        **kwargs:   Any
+    ):
+        """# Instantiate Lazy Argument Parser."""
+        # Initialize parser.
+        super().__init__(*args, **kwargs)
+
+        # Defer sub-parser construction by default.
+        self.register("action", "parsers", DeferredSubParsersAction)
@@ -0,0 +1,40 @@
+"""# ludorum.utilities.color
+
+Terminal coloring utilities.
+"""
+
+__all__ = ["USE_COLOR", "colored"]
+
+from os                     import environ
+from sys                    import stdout
+from typing                 import Any, Optional
+
+# Determine once whether output can render ANSI colors (honoring NO_COLOR & FORCE_COLOR).
+USE_COLOR:  bool =  not environ.get("NO_COLOR") and (bool(environ.get("FORCE_COLOR")) or stdout.isatty())
+
+def colored(
+    text:   str,
+    color:  Optional[str] = None,
+    **kwargs:   Any
+) -> str:
+    """# Colored (Text).
+
+    Wrap text in ANSI color codes, if output supports them. Otherwise, text is returned as is and 
+    termcolor is never imported.
+
+    ## Args:
+        * text      (str):  Text being colored.
+        * color     (str):  Name of text color. Defaults to None.
+        * kwargs    (Any):  Additional arguments passed to `termcolor.colored`.
+
+    ## Returns:
+        * str:  Colored text.
+    """
+    # Leave text untouched when colors cannot be rendered.
+    if not USE_COLOR:   return text
+
+    # Otherwise, defer to termcolor.
+    from termcolor  import colored as _colored_
+
+    # Color text.
+    return _colored_(text = text, color = color, **kwargs)
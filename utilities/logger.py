@@ -5,14 +5,140 @@ Logging utilities.
 
 __all__ = ["LOGGER", "get_logger"]
 
-from logging                import getLogger, Formatter, Logger, StreamHandler
-from logging.handlers       import RotatingFileHandler
+import logging
+
+from atexit                 import register
+from logging                import getLogger, Formatter, Logger, LogRecord, StreamHandler
+from logging.handlers       import QueueHandler, QueueListener, RotatingFileHandler
 from os                     import makedirs
+from os.path                import isdir
+from queue                  import SimpleQueue
 from sys                    import stdout
+from time                   import strftime
+from typing                 import Any, Optional, TextIO, Tuple
 
 # Declare logger object.
 LOGGER:         Logger
 
+# Records only need the fields referenced by the formatters below (time, level, name, & message), so 
+# skip the frame walk for caller information and the thread/process lookups made for every record.
+logging._srcfile =              None
+logging.logThreads =            False
+logging.logProcesses =          False
+logging.logMultiprocessing =    False
+logging.logAsyncioTasks =       False
+
+class SecondCachingFormatter(Formatter):
+    """# Second Caching Formatter
+
+    Formatter that renders the date & time portion of record timestamps at most once per second, 
+    since bursts of records share it (only milliseconds are rendered per record).
+    """
+    
+    def __init__(self,
+        fmt:    str,
+        style:  str =   "{"
+    ):
+        """# Instantiate Second Caching Formatter.
+
+        ## Args:
+            * fmt   (str):  Record format.
+            * style (str):  Format style. Defaults to "{".
+        """
+        # Initialize formatter.
+        super().__init__(fmt = fmt, style = style)
+        
+        # Initialize cached second & its rendering (paired, so that they are swapped atomically when 
+        # the formatter is shared by several listener threads).
+        self._cache_:   Tuple[int, str] =   (-1, "")
+        
+    def formatTime(self,
+        record:     LogRecord,
+        datefmt:    Optional[str] = None
+    ) -> str:
+        """# Format Time.
+
+        ## Args:
+            * record    (LogRecord):    Record whose creation time is being formatted.
+            * datefmt   (str):          Date/time format. Defaults to formatter's default.
+
+        ## Returns:
+            * str:  Formatted creation time.
+        """
+        # Fetch cached rendering.
+        second, stamp =     self._cache_
+        
+        # Render date & time only once record falls within a new second.
+        if int(record.created) != second:
+            
+            second:     int =   int(record.created)
+            stamp:      str =   strftime(datefmt or self.default_time_format, self.converter(second))
+            
+            # Cache rendering.
+            self._cache_:   Tuple[int, str] =   (second, stamp)
+        
+        # Append milliseconds, as the stock formatter does when no date format is given.
+        return stamp if datefmt else self.default_msec_format % (stamp, record.msecs)
+
+class SizeRotatingFileHandler(RotatingFileHandler):
+    """# Size Rotating File Handler
+
+    Rotating file handler that decides on rollover from the current size of the log file alone. The 
+    stock handler formats every record twice (once to measure it, once to write it) and stats the 
+    log file on each emission. The log directory is only created once the file is first opened.
+    """
+    
+    def __init__(self,
+        directory:  str,
+        filename:   str,
+        **kwargs:   Any
+    ):
+        """# Instantiate Size Rotating File Handler.
+
+        ## Args:
+            * directory (str):  Directory in which log file is written.
+            * filename  (str):  Name of log file within directory.
+            * kwargs    (Any):  Additional arguments passed to `RotatingFileHandler`.
+        """
+        # Define log directory (kept apart from file name, so that it never has to be split back out).
+        self._directory_:   str =   directory
+        
+        # Initialize handler.
+        super().__init__(filename = f"{directory}/{filename}", **kwargs)
+    
+    def _open(self) -> TextIO:
+        """# Open (Log File).
+
+        ## Returns:
+            * TextIO:   Stream of log file, created along with its directory if necessary.
+        """
+        # Ensure that log directory exists.
+        if not isdir(self._directory_): makedirs(name = self._directory_, exist_ok = True)
+        
+        # Open log file.
+        return super()._open()
+    
+    def shouldRollover(self,
+        record: LogRecord
+    ) -> bool:
+        """# Should Rollover?
+
+        ## Args:
+            * record    (LogRecord):    Record about to be emitted (not inspected).
+
+        ## Returns:
+            * bool: True if log file has reached its maximum size.
+        """
+        # Open stream if it has not been opened yet.
+        if self.stream is None: self.stream = self._open()
+        
+        # Rollover once file has grown to its maximum size (a file may exceed it by one record).
+        return 0 < self.maxBytes <= self.stream.tell()
+
+# Define formatters once, to be shared by the handlers of every logger.
+_CONSOLE_FORMATTER_:    Formatter =                 Formatter("{levelname} | {name} | {message}", style = "{")
+_FILE_FORMATTER_:       SecondCachingFormatter =    SecondCachingFormatter("{asctime} | {levelname} | {name} | {message}")
+
 def get_logger(
     logger_name:    str,
     logging_level:  str =   "INFO",
@@ -20,7 +146,9 @@ def get_logger(
 ) -> Logger:
     """# Initialize Logger.
     
-    Initialize a logger object with configuration provided.
+    Initialize a logger object with configuration provided. A logger is only configured once; 
+    subsequent calls for the same name update its level and return it as is (rather than attaching 
+    duplicate handlers, which would write every record several times).
 
     ## Args:
         * logger_name   (str):              Name attributed to logger object. This should usually 
@@ -32,9 +160,6 @@ def get_logger(
     ## Returns:
         * Logger:   Logger object, initialized with provided parameters.
     """
-    # Ensure that logging path exists
-    makedirs(name = logging_path, exist_ok = True)
-    
     # Declare globals.
     global LOGGER
 
@@ -45,28 +170,48 @@ def get_logger(
 
     # Set logging level
     LOGGER.setLevel(level = logging_level)
-
+    
+    # Logger has already been configured.
+    if LOGGER.handlers: return LOGGER
+    
     # Define console handler
     stdout_handler: StreamHandler =         StreamHandler(
                                                 stream =        stdout
                                             )
 
     # Define file handler
-    file_handler:   RotatingFileHandler =   RotatingFileHandler(
-                                                filename =      f"{logging_path}/{logger_name}.log",
+    file_handler:   RotatingFileHandler =   SizeRotatingFileHandler(
+                                                directory =     logging_path,
+                                                filename =      f"{logger_name}.log",
                                                 maxBytes =      1048576,
-                                                backupCount =   10
+                                                backupCount =   10,
+                                                delay =         True
                                             )
     
     # Define format for console handler.
-    stdout_handler.setFormatter(Formatter("%(levelname)s | %(name)s | %(message)s"))
+    stdout_handler.setFormatter(_CONSOLE_FORMATTER_)
     
     # Define format fror file handler.
-    file_handler.setFormatter(Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
+    file_handler.setFormatter(_FILE_FORMATTER_)
+    
+    # Define queue through which records are handed off.
+    queue:          SimpleQueue =           SimpleQueue()
+    
+    # Define listener, which writes records to console & file from a background thread, such that 
+    # logging calls never block on I/O.
+    listener:       QueueListener =         QueueListener(
+                                                queue,
+                                                stdout_handler,
+                                                file_handler,
+                                                respect_handler_level = True
+                                            )
+    
+    # Start listener, and stop it at exit so that queued records are flushed.
+    listener.start()
+    register(listener.stop)
     
-    # Add handlers to logger.
-    LOGGER.addHandler(hdlr = stdout_handler)
-    LOGGER.addHandler(hdlr = file_handler)
+    # Add queue handler to logger.
+    LOGGER.addHandler(hdlr = QueueHandler(queue = queue))
     
     # Return logger object.
     return LOGGER
@@ -76,7 +221,9 @@ def get_child(
 ) -> Logger:
     """# Initialize Child Logger.
     
-    Declares a logger child descendent of root logger.
+    Declares a logger child descendent of root logger. Since f-string messages are rendered before 
+    the logger can filter them, debug messages emitted from hot loops should be guarded by 
+    `logger.isEnabledFor(DEBUG)`, which reduces a filtered call to a cached level comparison.
 
     ## Args:
         * logger_name   (str):  Name attributed to child logger.